@@ -5,7 +5,8 @@ Evaluates air filter usage and effectiveness for indoor air quality.
 """
 
 from typing import Dict, List, Tuple
-import re
+
+from .regex_registry import WHITESPACE_RE
 
 
 class AirFilterRuleset:
@@ -32,7 +33,7 @@ class AirFilterRuleset:
         # Lowercase
         text = text.lower()
         # Collapse whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text.strip()
     
     def _detect_hepa(self, text: str) -> bool:
@@ -24,6 +24,8 @@ Evidence base:
 from typing import Dict, List, Tuple, Any
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class AlcoholFlushingRuleset:
     """Ruleset for evaluating alcohol flushing (radio + optional free text with context-driven scoring)."""
@@ -39,7 +41,7 @@ class AlcoholFlushingRuleset:
         if not text:
             return ""
         text = str(text).lower().strip()
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text
     
     def _detect_flush_redness(self, text: str) -> bool:
@@ -30,6 +30,8 @@ Per-field cap: -0.30 ≤ (GA, IMM, SKN) ≤ +0.35
 from typing import Dict, Tuple, List, Any, Optional
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class BreastfeedingRuleset:
     """Ruleset for evaluating breastfeeding history."""
@@ -41,7 +43,7 @@ class BreastfeedingRuleset:
     def _normalize_text(self, text: str) -> str:
         """Normalize text: lowercase, collapse whitespace."""
         text = text.lower()
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text.strip()
     
     def _extract_months(self, text: str) -> Optional[int]:
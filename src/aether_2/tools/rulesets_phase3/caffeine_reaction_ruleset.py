@@ -22,6 +22,8 @@ Evidence base:
 from typing import Dict, List, Tuple, Any
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class CaffeineReactionRuleset:
     """Ruleset for evaluating caffeine reaction (radio selection with context-driven scoring)."""
@@ -37,7 +39,7 @@ class CaffeineReactionRuleset:
         if not text:
             return ""
         text = str(text).lower().strip()
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text
     
     def get_caffeine_reaction_weights(
@@ -5,9 +5,10 @@ Evaluates unusual sensitivity to small amounts of chemicals, perfumes, smoke, or
 Radio: Yes/No with optional free text for triggers and reactions.
 """
 
-import re
 from typing import Dict, List, Tuple
 
+from .regex_registry import WHITESPACE_RE
+
 
 class ChemicalSensitivityRuleset:
     """
@@ -49,7 +50,7 @@ class ChemicalSensitivityRuleset:
         if not text:
             return ""
         text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text
     
     def _detect_fragrances(self, text: str) -> bool:
@@ -16,6 +16,8 @@ Author: Aether AI Engine
 from typing import Dict, List, Tuple, Any
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class ChildhoodHomeSecurityRuleset:
     """
@@ -69,7 +71,7 @@ class ChildhoodHomeSecurityRuleset:
         # Lowercase
         text = text.lower()
         # Collapse multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text.strip()
     
     def _keyword_match(self, text: str, keyword: str) -> bool:
@@ -7,6 +7,8 @@ Uses NLP-based keyword detection with age-of-exposure and frequency multipliers.
 from typing import Dict, List, Tuple, Any
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class ChildhoodIllnessesRuleset:
     """
@@ -87,7 +89,7 @@ class ChildhoodIllnessesRuleset:
         if not text:
             return ""
         text = text.lower()
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text.strip()
     
     def _keyword_match(self, text: str, keyword: str) -> bool:
@@ -56,11 +56,17 @@ PHASE3_FIELD_CONTEXT = {
     37: "AirFilter",  # Air filter usage (radio with optional brand/model text)
 }
 
+# Dense view of PHASE3_FIELD_CONTEXT indexed by field number (None for unused slots)
+PHASE3_FIELD_CONTEXT_TUPLE = tuple(
+    PHASE3_FIELD_CONTEXT.get(i) for i in range(max(PHASE3_FIELD_CONTEXT) + 1)
+)
+
 # ============================================================================
 # NLP UTILITIES - Shared across Phase 3 rulesets
 # ============================================================================
 
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
+import re
 import warnings
 
 # Check for optional NLP libraries
@@ -84,6 +90,36 @@ except ImportError:
         ImportWarning
     )
 
+try:
+    import wordfreq
+    WORDFREQ_AVAILABLE = True
+except ImportError:
+    WORDFREQ_AVAILABLE = False
+    warnings.warn(
+        "wordfreq not available. Install with: pip install wordfreq",
+        ImportWarning
+    )
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    warnings.warn(
+        "pyahocorasick not available. Install with: pip install pyahocorasick",
+        ImportWarning
+    )
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    warnings.warn(
+        "google-re2 not available. Install with: pip install google-re2",
+        ImportWarning
+    )
+
 # Global spaCy model instance (loaded once, shared across all rulesets)
 _SPACY_NLP = None
 
@@ -103,7 +139,10 @@ def get_spacy_model():
     if _SPACY_NLP is None:
         try:
             import spacy
-            _SPACY_NLP = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+            # Only token.lemma_ is used: exclude (not just disable) the parser and NER
+            # so their weights are never loaded; tagger + attribute_ruler stay because
+            # the rule-based lemmatizer needs POS tags
+            _SPACY_NLP = spacy.load("en_core_web_sm", exclude=["parser", "ner"])
             print("✅ spaCy model loaded successfully (lemmatization enabled)")
         except OSError:
             print("⚠️  spaCy model not found. Run: python -m spacy download en_core_web_sm")
@@ -149,9 +188,21 @@ def preprocess_lexicons(lexicons: Dict[str, list], nlp=None) -> Dict[str, Set[st
     return lemmatized
 
 
+# Memoized lemmas keyed by (model, text): goals and keywords recur across requests.
+# Cleared wholesale when full, which keeps lookups a single dict probe.
+_LEMMA_CACHE: Dict[tuple, str] = {}
+_LEMMA_CACHE_SIZE = 8192
+
+
+def _remember_lemma(key: tuple, lemma: str) -> None:
+    if len(_LEMMA_CACHE) >= _LEMMA_CACHE_SIZE:
+        _LEMMA_CACHE.clear()
+    _LEMMA_CACHE[key] = lemma
+
+
 def lemmatize_text(text: str, nlp=None) -> str:
     """
-    Convert text to lemmatized form.
+    Convert text to lemmatized form (memoized per model and text).
 
     Args:
         text: Input text
@@ -174,8 +225,46 @@ def lemmatize_text(text: str, nlp=None) -> str:
     if not nlp:
         return text
 
-    doc = nlp(text)
-    return " ".join([token.lemma_ for token in doc])
+    key = (nlp, text)
+    lemma = _LEMMA_CACHE.get(key)
+    if lemma is None:
+        doc = nlp(text)
+        lemma = " ".join([token.lemma_ for token in doc])
+        _remember_lemma(key, lemma)
+    return lemma
+
+
+def lemmatize_texts(texts: List[str], nlp=None) -> List[str]:
+    """
+    Batch version of lemmatize_text: runs all uncached texts through one nlp.pipe call.
+
+    Args:
+        texts: Input texts
+        nlp: Optional spaCy model (will load if not provided)
+
+    Returns:
+        Lemmatized texts, in input order (unchanged if spaCy is unavailable)
+    """
+    if nlp is None:
+        nlp = get_spacy_model()
+
+    if not nlp:
+        return list(texts)
+
+    lemmas: Dict[str, str] = {}
+    missing: List[str] = []
+    for text in dict.fromkeys(texts):
+        lemma = _LEMMA_CACHE.get((nlp, text))
+        if lemma is None:
+            missing.append(text)
+        else:
+            lemmas[text] = lemma
+    for text, doc in zip(missing, nlp.pipe(missing)):
+        lemma = " ".join([token.lemma_ for token in doc])
+        lemmas[text] = lemma
+        _remember_lemma((nlp, text), lemma)
+
+    return [lemmas[text] for text in texts]
 
 
 def match_keyword_fuzzy(keyword: str, text: str, threshold: int = 85) -> bool:
@@ -219,10 +308,83 @@ def match_keyword_fuzzy(keyword: str, text: str, threshold: int = 85) -> bool:
     return False
 
 
+def build_keyword_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton for one-pass multi-keyword matching.
+
+    Args:
+        keywords: Iterable of (keyword, payload) pairs; `automaton.iter(text)`
+            yields (end_index, payload) for every occurrence of a keyword
+
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not available
+        (callers fall back to plain substring scans)
+
+    Example:
+        >>> ac = build_keyword_automaton([("gas stove", "gas_stove")])
+        >>> list(ac.iter("old gas stove"))
+        [(12, "gas_stove")]
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    import ahocorasick
+
+    automaton = ahocorasick.Automaton()
+    for keyword, payload in keywords:
+        automaton.add_word(keyword, payload)
+
+    if len(automaton) == 0:
+        return None
+
+    automaton.make_automaton()
+    return automaton
+
+
+def compile_regex(pattern: str):
+    """
+    Compile a regex with RE2 (linear-time DFA engine) when available.
+
+    Falls back to Python's `re` if google-re2 is not installed or the pattern
+    uses features RE2 does not support (lookarounds, backreferences).
+    Note that RE2 treats \\b and \\d as ASCII-only.
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        Compiled pattern exposing the usual search/finditer/sub API
+    """
+    if RE2_AVAILABLE:
+        import re2
+
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+
+    return re.compile(pattern)
+
+
 # ============================================================================
 # LLM UTILITIES - For complex NLP tasks
 # ============================================================================
 
+
+def _extract_llm_content(response) -> str:
+    """Extract stripped text content from a LiteLLM completion response."""
+    if response and response.choices and len(response.choices) > 0:
+        content = response.choices[0].message.content
+        if content is not None:
+            return content.strip()
+        else:
+            print(f"⚠️  LLM returned None content")
+            return ""
+    else:
+        print(f"⚠️  Empty response from LLM")
+        return ""
+
+
 def call_vertex_ai_llm(prompt: str, temperature: float = 0.0, model: str = "vertex_ai/gemini-2.5-flash") -> str:
     """
     Make a simple, independent API call to Vertex AI using LiteLLM.
@@ -256,22 +418,75 @@ def call_vertex_ai_llm(prompt: str, temperature: float = 0.0, model: str = "vert
         )
 
         # Extract text from response
-        if response and response.choices and len(response.choices) > 0:
-            content = response.choices[0].message.content
-            if content is not None:
-                return content.strip()
-            else:
-                print(f"⚠️  LLM returned None content")
-                return ""
-        else:
-            print(f"⚠️  Empty response from LLM")
-            return ""
+        return _extract_llm_content(response)
 
     except Exception as e:
         print(f"❌ Error calling Vertex AI LLM: {e}")
         return ""
 
 
+async def call_vertex_ai_llm_batch(
+    prompts: List[str],
+    temperature: float = 0.0,
+    model: str = "vertex_ai/gemini-2.5-flash"
+) -> List[Optional[str]]:
+    """
+    Send several independent prompts to Vertex AI concurrently using LiteLLM.
+
+    A coroutine: await it from the caller's event loop (e.g. a FastAPI
+    handler), so network latency overlaps across prompts instead of being
+    paid one call at a time.
+
+    Args:
+        prompts: Prompts to send (one LLM call each)
+        temperature: Temperature setting (0.0 = deterministic, 1.0 = creative)
+        model: Model identifier (default: vertex_ai/gemini-2.5-flash)
+
+    Returns:
+        List of responses in the same order as `prompts`; None for any prompt
+        whose call failed (the error is logged), so failures stay distinct
+        from empty answers
+
+    Example:
+        >>> await call_vertex_ai_llm_batch(["Categorize: pizza", "Categorize: salad"])
+        ["Refined carbs/UPF", "Vegetables"]
+    """
+    if not prompts:
+        return []
+
+    import asyncio
+
+    try:
+        from litellm import acompletion
+    except ImportError as e:
+        print(f"❌ Error calling Vertex AI LLM: {e}")
+        return [None] * len(prompts)
+
+    responses = await asyncio.gather(
+        *[
+            acompletion(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=1500
+            )
+            for prompt in prompts
+        ],
+        return_exceptions=True
+    )
+
+    results: List[Optional[str]] = []
+    for index, response in enumerate(responses):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response  # cancellation, KeyboardInterrupt, ...
+            print(f"❌ Error calling Vertex AI LLM (prompt {index}): {response!r}")
+            results.append(None)
+        else:
+            results.append(_extract_llm_content(response))
+    return results
+
+
 # Export all shared constants plus Phase 3-specific ones
 __all__ = [
     # Shared from Phase 2
@@ -282,14 +497,22 @@ __all__ = [
     "detect_shift_work",
     # Phase 3-specific
     "PHASE3_FIELD_CONTEXT",
+    "PHASE3_FIELD_CONTEXT_TUPLE",
     # NLP utilities
     "SPACY_AVAILABLE",
     "RAPIDFUZZ_AVAILABLE",
+    "WORDFREQ_AVAILABLE",
+    "AHOCORASICK_AVAILABLE",
+    "RE2_AVAILABLE",
     "get_spacy_model",
     "preprocess_lexicons",
     "lemmatize_text",
+    "lemmatize_texts",
     "match_keyword_fuzzy",
+    "build_keyword_automaton",
+    "compile_regex",
     # LLM utilities
     "call_vertex_ai_llm",
+    "call_vertex_ai_llm_batch",
 ]
 
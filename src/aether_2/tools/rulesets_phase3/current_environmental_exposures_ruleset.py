@@ -5,9 +5,55 @@ Multi-select with optional "Other" free text.
 NLP-based scoring with duration/frequency modifiers and mitigation discounts.
 """
 
-import re
 from typing import Dict, List, Tuple, Any
 
+from .constants import build_keyword_automaton
+from .regex_registry import WHITESPACE_RE, INTEGER_YEARS_RE, INTEGER_MONTHS_RE
+
+
+# Treat ";" as "," so multi-select input splits with a single str.split
+_SEP_TRANS = str.maketrans(";", ",")
+
+# Map user-friendly text to internal keys (first matching key wins, in this order)
+_OPTION_MAPPING = {
+    "water leaks": "water_leaks",
+    "dampness": "water_leaks",
+    "water leaks / dampness": "water_leaks",
+    "ongoing renovations": "renovations",
+    "renovations": "renovations",
+    "fresh paint": "paint_VOCs",
+    "vocs": "paint_VOCs",
+    "fresh paint / vocs": "paint_VOCs",
+    "new carpet": "new_carpet_glue",
+    "flooring glue": "new_carpet_glue",
+    "new carpet / flooring glue": "new_carpet_glue",
+    "poor ventilation": "poor_ventilation",
+    "stale air": "poor_ventilation",
+    "poor ventilation / stale air": "poor_ventilation",
+    "gas stove": "gas_stove",
+    "wood-burning fireplace": "wood_fireplace",
+    "wood fireplace": "wood_fireplace",
+    "fireplace": "wood_fireplace",
+    "pets indoors": "pets_indoors",
+    "pets": "pets_indoors",
+    "heavy fragrance": "heavy_fragrance",
+    "air fresheners": "heavy_fragrance",
+    "scented candles": "heavy_fragrance",
+    "heavy fragrance / air fresheners": "heavy_fragrance",
+    "high-emf sources": "high_EMF_server_room",
+    "high emf": "high_EMF_server_room",
+    "server room": "high_EMF_server_room",
+    "high-emf sources (server room)": "high_EMF_server_room",
+    "other building issues": "other",
+    "other": "other"
+}
+
+# One-pass matcher over all option keys; payload carries the key's priority so the
+# earliest key in _OPTION_MAPPING still wins when several keys occur in one part
+_OPTION_AUTOMATON = build_keyword_automaton(
+    (key, (priority, value)) for priority, (key, value) in enumerate(_OPTION_MAPPING.items())
+)
+
 
 class CurrentEnvironmentalExposuresRuleset:
     """
@@ -47,9 +93,7 @@ class CurrentEnvironmentalExposuresRuleset:
         if not text:
             return ""
         # Lowercase, collapse whitespace
-        text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        return WHITESPACE_RE.sub(" ", text.lower().strip())
     
     def _parse_selections(self, exposure_data: str) -> Tuple[List[str], str]:
         """
@@ -60,46 +104,11 @@ class CurrentEnvironmentalExposuresRuleset:
         Returns:
             Tuple of (selected_options, other_text)
         """
-        if not exposure_data or not str(exposure_data).strip():
+        if not exposure_data or not exposure_data.strip():
             return [], ""
         
         # Split by comma or semicolon
-        parts = re.split(r'[,;]', str(exposure_data))
-        parts = [p.strip() for p in parts if p.strip()]
-        
-        # Map user-friendly text to internal keys
-        option_mapping = {
-            "water leaks": "water_leaks",
-            "dampness": "water_leaks",
-            "water leaks / dampness": "water_leaks",
-            "ongoing renovations": "renovations",
-            "renovations": "renovations",
-            "fresh paint": "paint_VOCs",
-            "vocs": "paint_VOCs",
-            "fresh paint / vocs": "paint_VOCs",
-            "new carpet": "new_carpet_glue",
-            "flooring glue": "new_carpet_glue",
-            "new carpet / flooring glue": "new_carpet_glue",
-            "poor ventilation": "poor_ventilation",
-            "stale air": "poor_ventilation",
-            "poor ventilation / stale air": "poor_ventilation",
-            "gas stove": "gas_stove",
-            "wood-burning fireplace": "wood_fireplace",
-            "wood fireplace": "wood_fireplace",
-            "fireplace": "wood_fireplace",
-            "pets indoors": "pets_indoors",
-            "pets": "pets_indoors",
-            "heavy fragrance": "heavy_fragrance",
-            "air fresheners": "heavy_fragrance",
-            "scented candles": "heavy_fragrance",
-            "heavy fragrance / air fresheners": "heavy_fragrance",
-            "high-emf sources": "high_EMF_server_room",
-            "high emf": "high_EMF_server_room",
-            "server room": "high_EMF_server_room",
-            "high-emf sources (server room)": "high_EMF_server_room",
-            "other building issues": "other",
-            "other": "other"
-        }
+        parts = [p.strip() for p in exposure_data.translate(_SEP_TRANS).split(",") if p.strip()]
         
         selected_options = []
         other_text = ""
@@ -109,12 +118,20 @@ class CurrentEnvironmentalExposuresRuleset:
             
             # Check if it matches a known option
             matched = False
-            for key, value in option_mapping.items():
-                if key in part_lower:
+            if _OPTION_AUTOMATON is not None:
+                hits = [payload for _, payload in _OPTION_AUTOMATON.iter(part_lower)]
+                if hits:
+                    value = min(hits)[1]
                     if value not in selected_options:
                         selected_options.append(value)
                     matched = True
-                    break
+            else:
+                for key, value in _OPTION_MAPPING.items():
+                    if key in part_lower:
+                        if value not in selected_options:
+                            selected_options.append(value)
+                        matched = True
+                        break
             
             # If not matched and looks like free text (>20 chars or contains spaces), treat as "other" text
             if not matched and (len(part) > 20 or ' ' in part):
@@ -137,15 +154,15 @@ class CurrentEnvironmentalExposuresRuleset:
         
         # Check for explicit duration patterns
         # >12 months
-        if re.search(r'(\d+)\s*(year|yr|y)\b', text_lower):
-            match = re.search(r'(\d+)\s*(year|yr|y)\b', text_lower)
+        match = INTEGER_YEARS_RE.search(text_lower)
+        if match:
             years = int(match.group(1))
             if years >= 1:
                 return ">12mo"
         
         # Months
-        if re.search(r'(\d+)\s*(month|mo|m)\b', text_lower):
-            match = re.search(r'(\d+)\s*(month|mo|m)\b', text_lower)
+        match = INTEGER_MONTHS_RE.search(text_lower)
+        if match:
             months = int(match.group(1))
             if months < 3:
                 return "<3mo"
@@ -264,12 +281,13 @@ class CurrentEnvironmentalExposuresRuleset:
         weights: Dict[str, float] = {}
         flags: List[str] = []
 
-        # Handle empty/None input
-        if not exposure_data or not str(exposure_data).strip():
+        # Coerce once; handle empty/None input
+        exposure_text = exposure_data if isinstance(exposure_data, str) else str(exposure_data or "")
+        if not exposure_text.strip():
             return weights, flags
 
         # Parse selections
-        selected_options, other_text = self._parse_selections(str(exposure_data))
+        selected_options, other_text = self._parse_selections(exposure_text)
 
         if not selected_options:
             flags.append("No recognized environmental exposures detected")
@@ -294,12 +312,15 @@ class CurrentEnvironmentalExposuresRuleset:
                     selected_options.append(cat)
             flags.append(f"Other text classified as: {', '.join(other_categories) if other_categories else 'unrecognized'}")
 
+        # Freeze for O(1) membership in the per-exposure checks below
+        selected = frozenset(selected_options)
+
         # Track detected exposures
         exposures_detected = []
 
         # Base weights for each exposure type
         # C1) Water leaks / Dampness
-        if "water_leaks" in selected_options:
+        if "water_leaks" in selected:
             exposures_detected.append("Water leaks/Dampness")
             flags.append("Detected: Water leaks/Dampness (mold & damp microbiome)")
 
@@ -316,7 +337,7 @@ class CurrentEnvironmentalExposuresRuleset:
                 flags.append("Cross-field synergy: Water leaks + Phase 2 mold exposure → GA +0.10, IMM +0.10")
 
         # C2) Ongoing renovations
-        if "renovations" in selected_options:
+        if "renovations" in selected:
             exposures_detected.append("Ongoing renovations")
             flags.append("Detected: Ongoing renovations (demolition, sanding, adhesives)")
 
@@ -326,7 +347,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["COG"] = weights.get("COG", 0.0) + 0.10
 
         # C3) Fresh paint / VOCs
-        if "paint_VOCs" in selected_options:
+        if "paint_VOCs" in selected:
             exposures_detected.append("Fresh paint/VOCs")
             flags.append("Detected: Fresh paint/VOCs (formaldehyde, off-gassing)")
 
@@ -337,7 +358,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["SKN"] = weights.get("SKN", 0.0) + 0.10
 
         # C4) New carpet / Flooring glue
-        if "new_carpet_glue" in selected_options:
+        if "new_carpet_glue" in selected:
             exposures_detected.append("New carpet/Flooring glue")
             flags.append("Detected: New carpet/Flooring glue (VOC sources)")
 
@@ -347,7 +368,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["COG"] = weights.get("COG", 0.0) + 0.10
 
         # C5) Poor ventilation / Stale air
-        if "poor_ventilation" in selected_options:
+        if "poor_ventilation" in selected:
             exposures_detected.append("Poor ventilation/Stale air")
             flags.append("Detected: Poor ventilation/Stale air (concentrated VOCs/CO₂)")
 
@@ -357,7 +378,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["IMM"] = weights.get("IMM", 0.0) + 0.10
 
         # C6) Gas stove
-        if "gas_stove" in selected_options:
+        if "gas_stove" in selected:
             exposures_detected.append("Gas stove")
             flags.append("Detected: Gas stove (NO₂, PM, benzene)")
 
@@ -367,7 +388,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["DTX"] = weights.get("DTX", 0.0) + 0.10
 
         # C7) Wood-burning fireplace
-        if "wood_fireplace" in selected_options:
+        if "wood_fireplace" in selected:
             exposures_detected.append("Wood-burning fireplace")
             flags.append("Detected: Wood-burning fireplace (PM₂.₅, irritants)")
 
@@ -378,7 +399,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["SKN"] = weights.get("SKN", 0.0) + 0.10
 
         # C8) Pets indoors (incremental environment load)
-        if "pets_indoors" in selected_options:
+        if "pets_indoors" in selected:
             exposures_detected.append("Pets indoors")
 
             if has_pets_phase2:
@@ -395,7 +416,7 @@ class CurrentEnvironmentalExposuresRuleset:
                 weights["GA"] = weights.get("GA", 0.0) + 0.10
 
         # C9) Heavy fragrance / Air fresheners
-        if "heavy_fragrance" in selected_options:
+        if "heavy_fragrance" in selected:
             exposures_detected.append("Heavy fragrance/Air fresheners")
             flags.append("Detected: Heavy fragrance/Air fresheners (VOCs, terpenes, phthalates)")
 
@@ -406,7 +427,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["COG"] = weights.get("COG", 0.0) + 0.10
 
         # C10) High-EMF sources (server room)
-        if "high_EMF_server_room" in selected_options:
+        if "high_EMF_server_room" in selected:
             exposures_detected.append("High-EMF sources")
             flags.append("Detected: High-EMF sources (environmental stress)")
 
@@ -414,7 +435,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["COG"] = weights.get("COG", 0.0) + 0.10
 
         # C11) Printer/toner/ozone (from "Other" text)
-        if "printer_toner" in selected_options:
+        if "printer_toner" in selected:
             exposures_detected.append("Printer/toner/ozone")
             flags.append("Detected: Printer/toner/ozone (ultrafine particles)")
 
@@ -422,7 +443,7 @@ class CurrentEnvironmentalExposuresRuleset:
             weights["IMM"] = weights.get("IMM", 0.0) + 0.10
 
         # C12) Radon (from "Other" text) - log as safety item, no GI weight
-        if "radon" in selected_options:
+        if "radon" in selected:
             exposures_detected.append("Radon")
             flags.append("⚠️ SAFETY: Radon detected - recommend testing and mitigation")
             # No weights added for radon
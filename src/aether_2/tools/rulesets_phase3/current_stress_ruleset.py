@@ -4,7 +4,68 @@ Current Stress Ruleset (Field 20): "On a scale of 1-10, how high is your current
 Linear scaling with piecewise spillover weights for secondary focus areas.
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+
+
+def _base_stress_weights(s: int) -> Tuple[Tuple[str, float], ...]:
+    """
+    Primary + spillover weights for a validated stress score (before synergies).
+    
+    Evaluated once per score at import to build _STRESS_TABLE. Only non-zero
+    weights are written, so table rows never carry zero entries.
+    """
+    weights: Dict[str, float] = {}
+    
+    # 1) Primary STR weight (linear, monotonic)
+    # w_STR = 0.08 × (s - 1), ranges 0.00 (at s=1) to 0.72 (at s=10)
+    if s > 1:
+        weights["STR"] = 0.08 * (s - 1)
+    
+    # 2) Secondary spillover weights (piecewise)
+    
+    if s <= 3:
+        # Low stress: no spillover
+        pass
+    
+    elif 4 <= s <= 7:
+        # Moderate stress: linear spillover (zero at s=4)
+        if s > 4:
+            weights["COG"] = 0.03 * (s - 4)
+            weights["CM"] = 0.025 * (s - 4)
+            weights["GA"] = 0.02 * (s - 4)
+            weights["MITO"] = 0.015 * (s - 4)
+        
+        # Threshold at s=7 for IMM/HRM
+        if s >= 7:
+            weights["IMM"] = 0.02 * (s - 6)
+            weights["HRM"] = 0.02 * (s - 6)
+    
+    else:  # s >= 8
+        # High stress: moderate spillover + additional boosts
+        weights["COG"] = 0.03 * (s - 4) + 0.10
+        weights["CM"] = 0.025 * (s - 4) + 0.10
+        weights["GA"] = 0.02 * (s - 4) + 0.15
+        weights["IMM"] = 0.02 * (s - 6) + 0.10
+        weights["HRM"] = 0.02 * (s - 6) + 0.10
+        weights["MITO"] = 0.015 * (s - 4)
+    
+    return tuple(weights.items())
+
+
+# String inputs treated as a blank stress score
+_BLANK_STRESS_VALUES = frozenset({"", "None", "N/A", "NA"})
+
+# Base weights indexed by stress score 1-10 (index 0 unused)
+_STRESS_TABLE = ((),) + tuple(_base_stress_weights(s) for s in range(1, 11))
+
+# Same table as a dense matrix for batch scoring: rows = score 0-10, columns = focus areas
+_STRESS_FOCUS_AREAS = ("STR", "COG", "CM", "GA", "MITO", "IMM", "HRM")
+_STRESS_MATRIX = np.array([
+    [dict(row).get(fa, 0.0) for fa in _STRESS_FOCUS_AREAS]
+    for row in _STRESS_TABLE
+])
 
 
 class CurrentStressRuleset:
@@ -24,26 +85,33 @@ class CurrentStressRuleset:
     - Shift work or work stress ≥8 → GA +0.10
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         pass
     
-    def _validate_stress_score(self, stress_data: Any) -> Tuple[int, List[str]]:
+    def _validate_stress_score(self, stress_data: Any) -> Tuple[Optional[int], List[str]]:
         """
         Validate and normalize stress score to integer 1-10.
         
         Returns:
             Tuple of (validated score, warnings list)
         """
-        warnings = []
-        
-        # Handle None, empty, or non-numeric
-        if stress_data is None or stress_data == "" or stress_data in ["None", "N/A", "NA"]:
-            warnings.append("VALIDATION: Stress score is blank - cannot score")
-            return None, warnings
+        warnings: List[str] = []
         
-        # Convert to integer
+        # Convert to integer (numeric input is the common case, so it is tried first)
         try:
-            score = int(float(str(stress_data).strip()))
+            if isinstance(stress_data, (int, float)) and not isinstance(stress_data, bool):
+                score = int(stress_data)
+            elif isinstance(stress_data, str):
+                # Handle empty or placeholder strings
+                if stress_data in _BLANK_STRESS_VALUES:
+                    warnings.append("VALIDATION: Stress score is blank - cannot score")
+                    return None, warnings
+                score = int(float(stress_data.strip()))
+            elif stress_data is None:
+                warnings.append("VALIDATION: Stress score is blank - cannot score")
+                return None, warnings
+            else:
+                score = int(float(str(stress_data).strip()))
         except (ValueError, TypeError):
             warnings.append(f"VALIDATION: Stress score '{stress_data}' is non-numeric - cannot score")
             return None, warnings
@@ -61,11 +129,11 @@ class CurrentStressRuleset:
     def get_current_stress_weights(
         self,
         stress_data: Any,
-        age: int = None,
-        sleep_hours: float = None,
+        age: Optional[int] = None,
+        sleep_hours: Optional[float] = None,
         sleep_irregular: bool = False,
         shift_work: bool = False,
-        work_stress_level: int = None
+        work_stress_level: Optional[int] = None
     ) -> Tuple[Dict[str, float], List[str]]:
         """
         Calculate focus area weights based on current stress level (1-10).
@@ -81,8 +149,8 @@ class CurrentStressRuleset:
         Returns:
             Tuple of (weights dict, flags/warnings list)
         """
-        weights = {}
-        flags = []
+        weights: Dict[str, float] = {}
+        flags: List[str] = []
         
         # Adults only (age ≥18)
         if age is not None and age < 18:
@@ -96,52 +164,88 @@ class CurrentStressRuleset:
         if s is None:
             return weights, flags
         
-        # 1) Primary STR weight (linear, monotonic)
-        # w_STR = 0.08 × (s - 1), ranges 0.00 (at s=1) to 0.72 (at s=10)
-        weights["STR"] = 0.08 * (s - 1)
+        # 1-2) Primary STR weight + piecewise spillover (precomputed per score)
+        for fa, w in _STRESS_TABLE[s]:
+            weights[fa] = w
         
-        # 2) Secondary spillover weights (piecewise)
-        
-        if s <= 3:
-            # Low stress: no spillover
-            pass
-        
-        elif 4 <= s <= 7:
-            # Moderate stress: linear spillover
-            weights["COG"] = weights.get("COG", 0) + 0.03 * (s - 4)
-            weights["CM"] = weights.get("CM", 0) + 0.025 * (s - 4)
-            weights["GA"] = weights.get("GA", 0) + 0.02 * (s - 4)
-            weights["MITO"] = weights.get("MITO", 0) + 0.015 * (s - 4)
-            
-            # Threshold at s=7 for IMM/HRM
-            if s >= 7:
-                weights["IMM"] = weights.get("IMM", 0) + 0.02 * (s - 6)
-                weights["HRM"] = weights.get("HRM", 0) + 0.02 * (s - 6)
-        
-        else:  # s >= 8
-            # High stress: moderate spillover + additional boosts
-            weights["COG"] = weights.get("COG", 0) + 0.03 * (s - 4) + 0.10
-            weights["CM"] = weights.get("CM", 0) + 0.025 * (s - 4) + 0.10
-            weights["GA"] = weights.get("GA", 0) + 0.02 * (s - 4) + 0.15
-            weights["IMM"] = weights.get("IMM", 0) + 0.02 * (s - 6) + 0.10
-            weights["HRM"] = weights.get("HRM", 0) + 0.02 * (s - 6) + 0.10
-            weights["MITO"] = weights.get("MITO", 0) + 0.015 * (s - 4)
-        
-        # 3) Cross-field synergies
+        # 3) Cross-field synergies (unknown sleep / work stress never triggers)
+        if sleep_hours is None:
+            sleep_hours = float("inf")
+        if work_stress_level is None:
+            work_stress_level = 0
         
         # Sleep <6h or irregular + stress ≥7 → STR +0.10, COG +0.10
-        sleep_short_or_irregular = (sleep_hours is not None and sleep_hours < 6) or sleep_irregular
-        if sleep_short_or_irregular and s >= 7:
+        if (sleep_irregular or sleep_hours < 6) and s >= 7:
             weights["STR"] = weights.get("STR", 0) + 0.10
             weights["COG"] = weights.get("COG", 0) + 0.10
         
         # Shift work or work stress ≥8 → GA +0.10
-        high_work_stress = work_stress_level is not None and work_stress_level >= 8
-        if shift_work or high_work_stress:
+        if shift_work or work_stress_level >= 8:
             weights["GA"] = weights.get("GA", 0) + 0.10
         
-        # Remove zero scores
-        weights = {k: v for k, v in weights.items() if v != 0}
-        
         return weights, flags
-
+    
+    def get_current_stress_weights_batch(
+        self,
+        stress_scores: Any,
+        ages: Any = None,
+        sleep_hours: Any = None,
+        sleep_irregular: Any = False,
+        shift_work: Any = False,
+        work_stress_level: Any = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized version of get_current_stress_weights for many patients at once.
+        
+        Args:
+            stress_scores: Array-like / pandas Series of stress scores (one per patient)
+            ages: Optional array-like of ages (rows with age < 18 get no weights)
+            sleep_hours: Optional array-like of sleep hours (None/NaN = unknown)
+            sleep_irregular: Bool or array-like of bools
+            shift_work: Bool or array-like of bools
+            work_stress_level: Optional array-like of work stress levels (None/NaN = unknown)
+        
+        Returns:
+            Dict mapping focus area → float array (one weight per patient, 0.0 where
+            the score is blank/non-numeric or the patient is under 18). Validation
+            flags are not produced; use the scalar method when flags are needed.
+        """
+        import pandas as pd
+        
+        # Same parsing as _validate_stress_score: non-numeric → invalid, truncate, clamp 1-10
+        raw = pd.Series(stress_scores).astype(str).str.strip()
+        scores = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=float)
+        n = len(scores)
+        
+        valid = ~np.isnan(scores)
+        s = np.clip(np.trunc(np.where(valid, scores, 1.0)), 1, 10).astype(np.intp)
+        
+        if ages is not None:
+            age = np.broadcast_to(np.asarray(ages, dtype=float), (n,))
+            valid &= ~(age < 18)
+        
+        # 1-2) Primary + spillover weights: one row of the precomputed matrix per patient
+        weights = _STRESS_MATRIX[s]
+        weights[~valid] = 0.0
+        
+        # 3) Cross-field synergies
+        hours = np.broadcast_to(np.asarray(sleep_hours if sleep_hours is not None else np.nan, dtype=float), (n,))
+        irregular = np.broadcast_to(np.asarray(sleep_irregular, dtype=bool), (n,))
+        str_col = _STRESS_FOCUS_AREAS.index("STR")
+        cog_col = _STRESS_FOCUS_AREAS.index("COG")
+        ga_col = _STRESS_FOCUS_AREAS.index("GA")
+        
+        # Sleep <6h or irregular + stress ≥7 → STR +0.10, COG +0.10
+        sleep_synergy = valid & (s >= 7) & (irregular | (hours < 6))
+        weights[sleep_synergy, str_col] += 0.10
+        weights[sleep_synergy, cog_col] += 0.10
+        
+        # Shift work or work stress ≥8 → GA +0.10
+        shift = np.broadcast_to(np.asarray(shift_work, dtype=bool), (n,))
+        work_level = np.broadcast_to(
+            np.asarray(work_stress_level if work_stress_level is not None else np.nan, dtype=float), (n,)
+        )
+        work_synergy = valid & (shift | (work_level >= 8))
+        weights[work_synergy, ga_col] += 0.10
+        
+        return {fa: weights[:, i] for i, fa in enumerate(_STRESS_FOCUS_AREAS)}
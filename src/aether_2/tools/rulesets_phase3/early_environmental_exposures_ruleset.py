@@ -13,7 +13,161 @@ Scoring logic:
 """
 
 import re
-from typing import Dict, List, Tuple, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple, Any, Optional
+
+from .constants import build_keyword_automaton, compile_regex
+from .regex_registry import (
+    WHITESPACE_RE as _RE_WS,
+    DURATION_YEARS_RE as _RE_YEARS,
+    DURATION_MONTHS_RE as _RE_MONTHS,
+    DURATION_WEEKS_RE as _RE_WEEKS,
+)
+
+
+# Keyword alternations per category (each wrapped in word boundaries when compiled).
+# "lead" precedes "metals" so the fused scan below reports the lead-specific hit;
+# a lead hit always implies heavy metals.
+_CATEGORY_ALTERNATIONS = (
+    ("lead", r'lead'),
+    ("metals", r'lead|lead paint|mercury|amalgam|cadmium|arsenic|uranium|mine|smelter'),
+    ("smoke", r'secondhand smoke|smoking at home|smoke|wood stove|coal stove|'
+              r'parents smoked|cigarette|tobacco'),
+    ("pesticides", r'organophosphate|chlorpyrifos|malathion|ddt|glyphosate|weed killer|'
+                   r'farm spray|pesticide|herbicide|insecticide|farm'),
+    ("mold", r'mold|mildew|damp|musty|water.?damaged|water damage|leak|flooding'),
+    ("solvents", r'solvents?|thinners?|benzene|toluene|glue|paint fumes|voc|chemicals?|fumes'),
+    ("continuous", r'lived in|daily|every day|school near|home near|grew up|'
+                   r'childhood home|constant|always'),
+    ("intermittent", r'occasionally|sometimes|visits?|few times|once in a while'),
+    ("early_life", r'infant|baby|toddler|preschool|elementary|before age [1-5]|'
+                   r'under [1-5]|when i was [1-5]|as a child'),
+    ("ongoing", r'currently|still living|right now|today|present'),
+)
+
+# All categories fused into one pass. The lookahead makes every match zero-width, so
+# keywords from different categories may overlap (e.g. "smoking at home near ...")
+# and each match's lastgroup names the category that matched at that position.
+_RE_ALL_CATEGORIES = re.compile(
+    '(?=' + '|'.join(
+        r'(?P<' + name + r'>\b(?:' + alternation + r')\b)'
+        for name, alternation in _CATEGORY_ALTERNATIONS
+    ) + ')'
+)
+
+
+_RE_OPTIONAL_PLURAL = re.compile(r'^[a-z ]+s\?$')
+_RE_PLAIN_LITERAL = re.compile(r'^[a-z ]+$')
+
+
+def _split_literals(
+    alternations: Tuple[Tuple[str, str], ...]
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """
+    Split category alternations into plain literals (for Aho-Corasick) and
+    residual regex alternatives ("water.?damaged", "before age [1-5]", ...).
+    """
+    literals: Dict[str, List[str]] = {}
+    residual: Dict[str, List[str]] = {}
+    for name, alternation in alternations:
+        for alternative in alternation.split('|'):
+            if _RE_OPTIONAL_PLURAL.match(alternative):
+                forms = [alternative[:-2], alternative[:-1]]
+            elif _RE_PLAIN_LITERAL.match(alternative):
+                forms = [alternative]
+            else:
+                residual.setdefault(name, []).append(alternative)
+                continue
+            for form in forms:
+                literals.setdefault(form, [])
+                if name not in literals[form]:
+                    literals[form].append(name)
+    return literals, residual
+
+
+_CATEGORY_LITERALS, _CATEGORY_RESIDUAL = _split_literals(_CATEGORY_ALTERNATIONS)
+
+# Linear-time matcher over every literal keyword; payload = (keyword length, categories)
+_CATEGORY_AUTOMATON = build_keyword_automaton(
+    (keyword, (len(keyword), tuple(names))) for keyword, names in _CATEGORY_LITERALS.items()
+)
+
+# The few keywords that need real regex features, fused into one named-group pattern.
+# These keywords cannot overlap each other, so no lookahead is needed (keeps it RE2-compatible).
+_RE_RESIDUAL_CATEGORIES = compile_regex(
+    '|'.join(
+        r'(?P<' + name + r'>\b(?:' + '|'.join(alternatives) + r')\b)'
+        for name, alternatives in _CATEGORY_RESIDUAL.items()
+    )
+)
+
+# Cheap prefilter for the residual pattern: every residual keyword contains
+# "water" or one of the age digits 1-5
+_RESIDUAL_TRIGGER_WORD = "water"
+_RESIDUAL_TRIGGER_DIGITS = frozenset("12345")
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w class so automaton hits honour the same word boundaries."""
+    return char.isalnum() or char == '_'
+
+
+def _scan_categories(text_lower: str) -> Set[str]:
+    """Return the names of all keyword categories present in normalized text (single pass)."""
+    if _CATEGORY_AUTOMATON is not None:
+        categories: Set[str] = set()
+        last = len(text_lower) - 1
+        for end, (length, names) in _CATEGORY_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end < last and _is_word_char(text_lower[end + 1]):
+                continue
+            categories.update(names)
+        if _RESIDUAL_TRIGGER_WORD in text_lower or not _RESIDUAL_TRIGGER_DIGITS.isdisjoint(text_lower):
+            categories.update(m.lastgroup for m in _RE_RESIDUAL_CATEGORIES.finditer(text_lower) if m.lastgroup)
+    else:
+        categories = {m.lastgroup for m in _RE_ALL_CATEGORIES.finditer(text_lower) if m.lastgroup}
+
+    if "lead" in categories:
+        categories.add("metals")
+    return categories
+
+
+_VALID_RADIO = frozenset({"Yes", "No"})
+
+# Base weights per exposure category as (focus_area, base) pairs
+_BASE_LEAD = (("DTX", 0.45), ("IMM", 0.30), ("GA", 0.30), ("MITO", 0.25),
+              ("COG", 0.35), ("CM", 0.15), ("SKN", 0.10))  # Higher COG for lead
+_BASE_METALS = (("DTX", 0.45), ("IMM", 0.30), ("GA", 0.30), ("MITO", 0.25),
+                ("COG", 0.25), ("CM", 0.15), ("SKN", 0.10))
+_BASE_SMOKE = (("IMM", 0.30), ("CM", 0.30), ("DTX", 0.25), ("GA", 0.20),
+               ("MITO", 0.15), ("COG", 0.10))
+_BASE_PESTICIDES = (("DTX", 0.40), ("IMM", 0.30), ("COG", 0.30), ("MITO", 0.30),
+                    ("GA", 0.30))
+_BASE_MOLD = (("IMM", 0.45), ("DTX", 0.35), ("GA", 0.35), ("SKN", 0.30),
+              ("MITO", 0.20), ("COG", 0.20))
+_BASE_SOLVENTS = (("DTX", 0.35), ("IMM", 0.25), ("MITO", 0.25), ("COG", 0.20),
+                  ("GA", 0.20))
+
+# Fixed slot layout for the accumulator: weights live in a plain list indexed by
+# focus-area slot and are turned into a dict only once, at the end
+_EARLY_FOCUS_AREAS = ("DTX", "IMM", "GA", "MITO", "COG", "CM", "SKN")
+_SLOT = {fa: i for i, fa in enumerate(_EARLY_FOCUS_AREAS)}
+_GA_SLOT = _SLOT["GA"]
+
+
+def _to_slots(base_weights: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[int, float], ...]:
+    """Convert (focus_area, base) pairs to (slot, base) pairs."""
+    return tuple((_SLOT[fa], base) for fa, base in base_weights)
+
+
+_SLOTS_LEAD = _to_slots(_BASE_LEAD)
+_SLOTS_METALS = _to_slots(_BASE_METALS)
+_SLOTS_SMOKE = _to_slots(_BASE_SMOKE)
+_SLOTS_PESTICIDES = _to_slots(_BASE_PESTICIDES)
+_SLOTS_MOLD = _to_slots(_BASE_MOLD)
+_SLOTS_SOLVENTS = _to_slots(_BASE_SOLVENTS)
 
 
 class EarlyEnvironmentalExposuresRuleset:
@@ -22,16 +176,21 @@ class EarlyEnvironmentalExposuresRuleset:
     # Per-field caps
     MAX_WEIGHT_GENERAL = 1.5  # DTX, IMM, MITO, COG, CM, SKN
     MAX_WEIGHT_GA = 1.0       # GA has lower cap
+
+    # Cap per slot of _EARLY_FOCUS_AREAS (GA gets its own cap)
+    _SLOT_CAPS = (
+        (MAX_WEIGHT_GENERAL,) * _GA_SLOT
+        + (MAX_WEIGHT_GA,)
+        + (MAX_WEIGHT_GENERAL,) * (len(_EARLY_FOCUS_AREAS) - _GA_SLOT - 1)
+    )
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text: lowercase, collapse whitespace."""
         if not text:
             return ""
-        text = text.lower()
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return _RE_WS.sub(' ', text.lower()).strip()
     
-    def _extract_duration_months(self, text: str) -> Optional[int]:
+    def _extract_duration_months(self, text_lower: str) -> Optional[int]:
         """
         Extract exposure duration in months from free text.
         
@@ -42,22 +201,23 @@ class EarlyEnvironmentalExposuresRuleset:
         
         Returns:
             Number of months, or None if not found
-        """
-        text_lower = text.lower()
         
+        Note:
+            Expects already-normalized (lowercased) text.
+        """
         # Pattern 1: X years/yrs/y (convert to months)
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(?:years?|yrs?|y\b)', text_lower)
+        match = _RE_YEARS.search(text_lower)
         if match:
             years = float(match.group(1))
             return int(years * 12)
         
         # Pattern 2: X months/mo
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(?:months?|mo\b)', text_lower)
+        match = _RE_MONTHS.search(text_lower)
         if match:
             return int(float(match.group(1)))
         
         # Pattern 3: X weeks/wk (convert to months, ~4.3 weeks/month)
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(?:weeks?|wks?|wk\b)', text_lower)
+        match = _RE_WEEKS.search(text_lower)
         if match:
             weeks = float(match.group(1))
             return max(1, int(weeks / 4.3))  # At least 1 month
@@ -83,185 +243,57 @@ class EarlyEnvironmentalExposuresRuleset:
         else:
             return 1.4
     
-    def _detect_intensity(self, text: str) -> float:
-        """
-        Detect exposure intensity from text.
-        
-        Returns:
-            1.3 (continuous/"lived in"), 1.0 (intermittent/occasional)
-        """
-        text_lower = text.lower()
-        
-        # Continuous exposure keywords
-        continuous_keywords = [
-            r'\blived in\b', r'\bdaily\b', r'\bevery day\b',
-            r'\bschool near\b', r'\bhome near\b', r'\bgrew up\b',
-            r'\bchildhood home\b', r'\bconstant\b', r'\balways\b'
-        ]
-        
-        for keyword in continuous_keywords:
-            if re.search(keyword, text_lower):
-                return 1.3
-        
-        # Intermittent exposure keywords
-        intermittent_keywords = [
-            r'\boccasionally\b', r'\bsometimes\b', r'\bvisits?\b',
-            r'\bfew times\b', r'\bonce in a while\b'
-        ]
-        
-        for keyword in intermittent_keywords:
-            if re.search(keyword, text_lower):
-                return 1.0
-        
-        # Default: assume continuous if not specified
-        return 1.3
-    
-    def _detect_early_life(self, text: str) -> float:
-        """
-        Detect if exposure occurred in early life (age <5).
-        
-        Returns:
-            1.2 (early life), 1.0 (otherwise)
-        """
-        text_lower = text.lower()
-        
-        # Early life keywords
-        early_life_keywords = [
-            r'\binfant\b', r'\bbaby\b', r'\btoddler\b',
-            r'\bpreschool\b', r'\belementary\b',
-            r'\bbefore age [1-5]\b', r'\bunder [1-5]\b',
-            r'\bwhen i was [1-5]\b', r'\bas a child\b'
-        ]
-        
-        for keyword in early_life_keywords:
-            if re.search(keyword, text_lower):
-                return 1.2
-
-        return 1.0
-
-    def _detect_heavy_metals(self, text: str) -> bool:
-        """Detect heavy metal exposure keywords."""
-        text_lower = text.lower()
-
-        keywords = [
-            r'\blead\b', r'\blead paint\b', r'\bmercury\b', r'\bamalgam\b',
-            r'\bcadmium\b', r'\barsenic\b', r'\buranium\b',
-            r'\bmine\b', r'\bsmelter\b'
-        ]
-
-        for keyword in keywords:
-            if re.search(keyword, text_lower):
-                return True
-        return False
-
-    def _detect_lead_specific(self, text: str) -> bool:
-        """Detect lead-specific exposure (higher COG impact)."""
-        text_lower = text.lower()
-        return bool(re.search(r'\blead\b', text_lower))
-
-    def _detect_smoke(self, text: str) -> bool:
-        """Detect secondhand smoke exposure keywords."""
-        text_lower = text.lower()
-
-        keywords = [
-            r'\bsecondhand smoke\b', r'\bsmoking at home\b', r'\bsmoke\b',
-            r'\bwood stove\b', r'\bcoal stove\b', r'\bparents smoked\b',
-            r'\bcigarette\b', r'\btobacco\b'
-        ]
-
-        for keyword in keywords:
-            if re.search(keyword, text_lower):
-                return True
-        return False
-
-    def _detect_pesticides(self, text: str) -> bool:
-        """Detect pesticide/herbicide exposure keywords."""
-        text_lower = text.lower()
-
-        keywords = [
-            r'\borganophosphate\b', r'\bchlorpyrifos\b', r'\bmalathion\b',
-            r'\bddt\b', r'\bglyphosate\b', r'\bweed killer\b',
-            r'\bfarm spray\b', r'\bpesticide\b', r'\bherbicide\b',
-            r'\binsecticide\b', r'\bfarm\b'
-        ]
-
-        for keyword in keywords:
-            if re.search(keyword, text_lower):
-                return True
-        return False
-
-    def _detect_mold(self, text: str) -> bool:
-        """Detect mold/water damage exposure keywords."""
-        text_lower = text.lower()
-
-        keywords = [
-            r'\bmold\b', r'\bmildew\b', r'\bdamp\b', r'\bmusty\b',
-            r'\bwater.?damaged\b', r'\bwater damage\b', r'\bleak\b',
-            r'\bflooding\b'
-        ]
-
-        for keyword in keywords:
-            if re.search(keyword, text_lower):
-                return True
-        return False
-
-    def _detect_solvents(self, text: str) -> bool:
-        """Detect solvent/VOC exposure keywords."""
-        text_lower = text.lower()
-
-        keywords = [
-            r'\bsolvents?\b', r'\bthinners?\b', r'\bbenzene\b', r'\btoluene\b',
-            r'\bglue\b', r'\bpaint fumes\b', r'\bvoc\b',
-            r'\bchemicals?\b', r'\bfumes\b'
-        ]
-
-        for keyword in keywords:
-            if re.search(keyword, text_lower):
-                return True
-        return False
-
-    def _detect_ongoing_unsafe(self, text: str) -> bool:
-        """Detect ongoing unsafe living conditions."""
-        text_lower = text.lower()
-
-        keywords = [
-            r'\bcurrently\b', r'\bstill living\b', r'\bright now\b',
-            r'\btoday\b', r'\bpresent\b'
-        ]
-
-        for keyword in keywords:
-            if re.search(keyword, text_lower):
-                return True
-        return False
-
     def get_early_environmental_exposures_weights(
         self,
-        exposure_data: Any
+        exposure_data: Any,
+        collect_flags: bool = True
     ) -> Tuple[Dict[str, float], List[str]]:
         """
         Calculate focus area weights for early environmental/toxic exposures.
 
         Args:
             exposure_data: Radio (Yes/No) + optional free text (semicolon-separated)
+            collect_flags: If False, skip informational flags (multipliers, detections,
+                caps, summary); validation and safety flags are always returned
 
         Returns:
             Tuple of (weights dict, flags list)
         """
-        weights: Dict[str, float] = {}
-        flags: List[str] = []
-
         # Handle empty/None input
         if not exposure_data or not str(exposure_data).strip():
-            return weights, flags
+            return {}, []
 
-        # Parse input: "Radio; free text"
         exposure_str = str(exposure_data).strip()
+
+        # Fast path: "No" (optionally with ignored text) is the dominant answer
+        if exposure_str == "No" or exposure_str.startswith("No;"):
+            return {}, []
+
+        # Scoring is a pure function of the stripped text, so repeated answers hit the cache
+        weights, flags = _cached_early_exposure_weights(exposure_str, collect_flags)
+        return dict(weights), list(flags)
+
+    def _score_exposure_text(
+        self,
+        exposure_str: str,
+        collect_flags: bool = True
+    ) -> Tuple[Dict[str, float], List[str]]:
+        """
+        Score a stripped, non-empty "Radio; free text" answer (uncached).
+
+        Returns:
+            Tuple of (weights dict, flags list)
+        """
+        weights: Dict[str, float] = {}
+        flags: List[str] = []
+
+        # Parse input: "Radio; free text"
         parts = exposure_str.split(';', 1)
         radio = parts[0].strip()
         free_text = parts[1].strip() if len(parts) > 1 else ""
 
         # Validate radio selection
-        if radio not in ["Yes", "No"]:
+        if radio not in _VALID_RADIO:
             flags.append(f"Invalid radio selection: '{radio}' (expected Yes/No)")
             return weights, flags
 
@@ -282,156 +314,136 @@ class EarlyEnvironmentalExposuresRuleset:
         # Normalize text
         text_normalized = self._normalize_text(free_text)
 
-        # Extract multipliers
-        duration_months = self._extract_duration_months(text_normalized)
+        # Early exit: no keyword can match text that is too short or has no letters (e.g. "1994")
+        if len(text_normalized) < 3 or not any(ch.isalpha() for ch in text_normalized):
+            if collect_flags:
+                flags.append("No recognized exposures detected in free text")
+            return weights, flags
+
+        # Detect every keyword category in a single scan of the text
+        categories = _scan_categories(text_normalized)
+
+        # Extract multipliers (duration patterns all need a digit; skip them otherwise)
+        has_digit = any(ch.isdecimal() for ch in set(text_normalized))
+        duration_months = self._extract_duration_months(text_normalized) if has_digit else None
         duration_mul = self._get_duration_multiplier(duration_months)
-        intensity_mul = self._detect_intensity(text_normalized)
-        early_life_mul = self._detect_early_life(text_normalized)
+        # Continuous wins over intermittent; default assumes continuous
+        if "continuous" in categories:
+            intensity_mul = 1.3
+        elif "intermittent" in categories:
+            intensity_mul = 1.0
+        else:
+            intensity_mul = 1.3
+        early_life_mul = 1.2 if "early_life" in categories else 1.0
 
         # Log extracted multipliers
-        if duration_months:
-            flags.append(f"Extracted duration: {duration_months} months (multiplier: {duration_mul})")
-        flags.append(f"Intensity multiplier: {intensity_mul} ({'continuous' if intensity_mul > 1.0 else 'intermittent'})")
-        flags.append(f"Early life multiplier: {early_life_mul} ({'age <5' if early_life_mul > 1.0 else 'not specified'})")
+        if collect_flags:
+            if duration_months:
+                flags.append(f"Extracted duration: {duration_months} months (multiplier: {duration_mul})")
+            flags.append(f"Intensity multiplier: {intensity_mul} ({'continuous' if intensity_mul > 1.0 else 'intermittent'})")
+            flags.append(f"Early life multiplier: {early_life_mul} ({'age <5' if early_life_mul > 1.0 else 'not specified'})")
+
+        # Combined multiplier shared by every category contribution
+        mul = duration_mul * intensity_mul * early_life_mul
 
         # Detect exposures and apply base weights
-        exposures_detected = []
+        exposures_detected: List[str] = []
+        w: List[float] = [0.0] * len(_EARLY_FOCUS_AREAS)
 
         # B1) Heavy metals
-        if self._detect_heavy_metals(text_normalized):
+        if "metals" in categories:
             exposures_detected.append("Heavy metals")
 
             # Lead-specific: higher COG impact
-            if self._detect_lead_specific(text_normalized):
-                base_weights = {
-                    "DTX": 0.45,
-                    "IMM": 0.30,
-                    "GA": 0.30,
-                    "MITO": 0.25,
-                    "COG": 0.35,  # Higher for lead
-                    "CM": 0.15,
-                    "SKN": 0.10
-                }
-                flags.append("Detected: Lead exposure (higher COG impact)")
+            if "lead" in categories:
+                base_slots = _SLOTS_LEAD
+                if collect_flags:
+                    flags.append("Detected: Lead exposure (higher COG impact)")
             else:
-                base_weights = {
-                    "DTX": 0.45,
-                    "IMM": 0.30,
-                    "GA": 0.30,
-                    "MITO": 0.25,
-                    "COG": 0.25,
-                    "CM": 0.15,
-                    "SKN": 0.10
-                }
-                flags.append("Detected: Heavy metals (mercury/cadmium/arsenic/uranium)")
+                base_slots = _SLOTS_METALS
+                if collect_flags:
+                    flags.append("Detected: Heavy metals (mercury/cadmium/arsenic/uranium)")
 
             # Apply multipliers
-            for fa, base in base_weights.items():
-                contribution = base * duration_mul * intensity_mul * early_life_mul
-                weights[fa] = weights.get(fa, 0.0) + contribution
+            for slot, base in base_slots:
+                w[slot] += base * mul
 
             # GA minimum: +0.20 even if duration_mul < 1.0
-            if weights.get("GA", 0.0) < 0.20:
-                weights["GA"] = 0.20
-                flags.append("GA minimum applied: +0.20 (metals → dysbiosis/permeability)")
+            if w[_GA_SLOT] < 0.20:
+                w[_GA_SLOT] = 0.20
+                if collect_flags:
+                    flags.append("GA minimum applied: +0.20 (metals → dysbiosis/permeability)")
 
         # B2) Secondhand smoke
-        if self._detect_smoke(text_normalized):
+        if "smoke" in categories:
             exposures_detected.append("Secondhand smoke")
-            flags.append("Detected: Secondhand smoke / early smoke exposure")
-
-            base_weights = {
-                "IMM": 0.30,
-                "CM": 0.30,
-                "DTX": 0.25,
-                "GA": 0.20,
-                "MITO": 0.15,
-                "COG": 0.10
-            }
+            if collect_flags:
+                flags.append("Detected: Secondhand smoke / early smoke exposure")
 
             # Apply multipliers
-            for fa, base in base_weights.items():
-                contribution = base * duration_mul * intensity_mul * early_life_mul
-                weights[fa] = weights.get(fa, 0.0) + contribution
+            for slot, base in _SLOTS_SMOKE:
+                w[slot] += base * mul
 
         # B3) Pesticides/herbicides
-        if self._detect_pesticides(text_normalized):
+        if "pesticides" in categories:
             exposures_detected.append("Pesticides/herbicides")
-            flags.append("Detected: Pesticides/herbicides exposure")
-
-            base_weights = {
-                "DTX": 0.40,
-                "IMM": 0.30,
-                "COG": 0.30,
-                "MITO": 0.30,
-                "GA": 0.30
-            }
+            if collect_flags:
+                flags.append("Detected: Pesticides/herbicides exposure")
 
             # Apply multipliers
-            for fa, base in base_weights.items():
-                contribution = base * duration_mul * intensity_mul * early_life_mul
-                weights[fa] = weights.get(fa, 0.0) + contribution
+            for slot, base in _SLOTS_PESTICIDES:
+                w[slot] += base * mul
 
         # B4) Mold/water damage
-        if self._detect_mold(text_normalized):
+        if "mold" in categories:
             exposures_detected.append("Mold/water damage")
-            flags.append("Detected: Mold/water-damaged buildings")
-
-            base_weights = {
-                "IMM": 0.45,
-                "DTX": 0.35,
-                "GA": 0.35,
-                "SKN": 0.30,
-                "MITO": 0.20,
-                "COG": 0.20
-            }
+            if collect_flags:
+                flags.append("Detected: Mold/water-damaged buildings")
 
             # Apply multipliers
-            for fa, base in base_weights.items():
-                contribution = base * duration_mul * intensity_mul * early_life_mul
-                weights[fa] = weights.get(fa, 0.0) + contribution
+            for slot, base in _SLOTS_MOLD:
+                w[slot] += base * mul
 
         # B5) Solvents/VOCs
-        if self._detect_solvents(text_normalized):
+        if "solvents" in categories:
             exposures_detected.append("Solvents/VOCs")
-            flags.append("Detected: Solvents/VOCs exposure")
-
-            base_weights = {
-                "DTX": 0.35,
-                "IMM": 0.25,
-                "MITO": 0.25,
-                "COG": 0.20,
-                "GA": 0.20
-            }
+            if collect_flags:
+                flags.append("Detected: Solvents/VOCs exposure")
 
             # Apply multipliers
-            for fa, base in base_weights.items():
-                contribution = base * duration_mul * intensity_mul * early_life_mul
-                weights[fa] = weights.get(fa, 0.0) + contribution
+            for slot, base in _SLOTS_SOLVENTS:
+                w[slot] += base * mul
 
         # Safety check: ongoing unsafe living conditions
-        if self._detect_ongoing_unsafe(text_normalized):
+        if "ongoing" in categories:
             flags.append("⚠️ SAFETY: Ongoing unsafe living conditions detected → consider environmental remediation")
 
         # Apply per-field caps
-        for fa in weights:
-            if fa == "GA":
-                if weights[fa] > self.MAX_WEIGHT_GA:
-                    flags.append(f"GA capped at +{self.MAX_WEIGHT_GA} (was +{weights[fa]:.3f})")
-                    weights[fa] = self.MAX_WEIGHT_GA
-            else:
-                if weights[fa] > self.MAX_WEIGHT_GENERAL:
-                    flags.append(f"{fa} capped at +{self.MAX_WEIGHT_GENERAL} (was +{weights[fa]:.3f})")
-                    weights[fa] = self.MAX_WEIGHT_GENERAL
+        for slot, cap in enumerate(self._SLOT_CAPS):
+            if w[slot] > cap:
+                if collect_flags:
+                    flags.append(f"{_EARLY_FOCUS_AREAS[slot]} capped at +{cap} (was +{w[slot]:.3f})")
+                w[slot] = cap
 
-        # Remove zero weights
-        weights = {fa: w for fa, w in weights.items() if abs(w) > 1e-6}
+        # Materialize touched slots as the weights dict (untouched slots are exactly 0.0;
+        # bases and multipliers are positive, so touched slots never are)
+        weights = {fa: w[slot] for slot, fa in enumerate(_EARLY_FOCUS_AREAS) if w[slot]}
 
         # Summary
-        if exposures_detected:
-            flags.insert(0, f"Exposures detected: {', '.join(exposures_detected)}")
-        else:
-            flags.append("No recognized exposures detected in free text")
+        if collect_flags:
+            if exposures_detected:
+                flags.insert(0, f"Exposures detected: {', '.join(exposures_detected)}")
+            else:
+                flags.append("No recognized exposures detected in free text")
 
         return weights, flags
 
+
+@lru_cache(maxsize=4096)
+def _cached_early_exposure_weights(
+    exposure_str: str,
+    collect_flags: bool = True
+) -> Tuple[Tuple[Tuple[str, float], ...], Tuple[str, ...]]:
+    """Memoized scoring keyed on the stripped answer; returns immutable copies of the result."""
+    weights, flags = EarlyEnvironmentalExposuresRuleset()._score_exposure_text(exposure_str, collect_flags)
+    return tuple(weights.items()), tuple(flags)
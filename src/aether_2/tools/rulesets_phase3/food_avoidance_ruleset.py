@@ -6,23 +6,386 @@ Analyzes foods avoided due to symptoms using NLP-based pattern matching.
 Detects gluten, lactose, FODMAPs, histamine, GERD triggers, nightshades, and broad sensitivities.
 """
 
-from typing import Dict, Tuple, List, Any
+from typing import TYPE_CHECKING, Dict, Tuple, List, Any, Set
 import re
 from collections import defaultdict
+from functools import cached_property, lru_cache
 
 from .constants import (
     get_spacy_model,
     lemmatize_text,
-    match_keyword_fuzzy,
-    RAPIDFUZZ_AVAILABLE
+    RAPIDFUZZ_AVAILABLE,
+    WORDFREQ_AVAILABLE,
+    build_keyword_automaton
 )
 from .helpers import parse_yes_no_with_followup
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Food category lexicons with keywords and base weights.
+#
+# Structure: {
+#     "category_name": {
+#         "keywords": (...),
+#         "scores": {"GA": 0.45, ...},
+#         "skin_boost": 0.10  # Optional SKN boost if skin symptoms present
+#     }
+# }
+_FOOD_CATEGORIES: Dict[str, Dict[str, Any]] = {
+    # 1) Gluten/wheat
+    "gluten_wheat": {
+        "keywords": (
+            "gluten", "wheat", "bread", "pasta", "cereal", "flour",
+            "barley", "rye", "malt", "seitan", "couscous", "semolina"
+        ),
+        "scores": {"GA": 0.45, "IMM": 0.15},
+        "skin_boost": 0.10
+    },
+
+    # 2) Lactose/dairy
+    "lactose_dairy": {
+        "keywords": (
+            "milk", "dairy", "lactose", "ice cream", "cheese", "yogurt",
+            "cream", "butter", "whey", "casein", "kefir"
+        ),
+        "scores": {"GA": 0.35, "IMM": 0.10},
+        "skin_boost": 0.15
+    },
+
+    # 3) High-FODMAP foods
+    "high_fodmap": {
+        "keywords": (
+            "garlic", "onion", "beans", "lentils", "chickpeas",
+            "apples", "pears", "stone fruit", "peaches", "plums",
+            "cauliflower", "broccoli", "cabbage", "brussels sprouts",
+            "wheat", "rye", "honey", "agave", "high fructose"
+        ),
+        "scores": {"GA": 0.35, "IMM": 0.10},
+        "skin_boost": 0.0
+    },
+
+    # 4) Histamine-rich foods
+    "histamine_rich": {
+        "keywords": (
+            "aged cheese", "wine", "beer", "alcohol", "cured meat",
+            "salami", "pepperoni", "bacon", "ham", "sausage",
+            "vinegar", "kombucha", "fermented", "sauerkraut", "kimchi",
+            "leftovers", "tinned fish", "canned fish", "tuna", "sardines",
+            "tomato", "spinach", "eggplant", "avocado", "banana"
+        ),
+        "scores": {"GA": 0.35, "IMM": 0.20},
+        "skin_boost": 0.15
+    },
+
+    # 5) GERD-promoting foods
+    "gerd_triggers": {
+        "keywords": (
+            "spicy", "chili", "hot sauce", "capsaicin", "pepper",
+            "fried", "fatty", "greasy", "oily",
+            "large meal", "late meal", "eating late", "late night",
+            "carbonated", "soda", "pop", "fizzy", "sparkling",
+            "acidic", "citrus", "orange", "lemon", "grapefruit",
+            "coffee", "caffeine", "chocolate", "mint", "peppermint"
+        ),
+        "scores": {"GA": 0.20, "STR": 0.05},
+        "skin_boost": 0.0
+    },
+
+    # 6) Nightshades
+    "nightshades": {
+        "keywords": (
+            "nightshade", "tomato", "potato", "bell pepper", "peppers",
+            "eggplant", "aubergine", "goji", "paprika"
+        ),
+        "scores": {"GA": 0.10, "IMM": 0.10},
+        "skin_boost": 0.10
+    }
+}
+
+# Symptom keyword lists for linking foods to symptoms
+_SYMPTOMS = {
+    "gi_symptoms": (
+        "bloating", "gas", "cramps", "cramping", "diarrhea", "loose stool",
+        "constipation", "nausea", "vomiting", "reflux", "heartburn",
+        "acid", "burning", "indigestion", "upset stomach", "pain"
+    ),
+    "skin_symptoms": (
+        "rash", "hives", "eczema", "psoriasis", "acne", "breakout",
+        "itchy", "itching", "flush", "flushing", "red", "redness"
+    ),
+    "neuro_symptoms": (
+        "headache", "migraine", "brain fog", "foggy", "dizzy", "fatigue"
+    ),
+    "immediate_reactions": (
+        "hives", "angioedema", "anaphylaxis", "throat closing",
+        "swelling", "epipen", "emergency"
+    )
+}
+
+_ELIMINATION_KEYWORDS = (
+    "removing", "removed", "stopped", "quit", "avoiding", "eliminated",
+    "fixed", "helped", "better", "improved", "resolved"
+)
+
+# Safety keywords (immediate reactions)
+_SAFETY_KEYWORDS = (
+    "anaphylaxis", "throat closing", "throat swelling", "can't breathe",
+    "angioedema", "severe hives", "epipen", "emergency"
+)
+
+# GERD severity modifiers (late/large meals, carbonated drinks)
+_GERD_SEVERITY_KEYWORDS = (
+    "late meal", "late night", "eating late", "large meal", "big meal", "carbonated", "soda"
+)
+
+# Phrases that trigger the broad sensitivities rule on their own
+_BROAD_SENSITIVITY_PHRASES = (
+    "many foods", "lots of foods", "multiple foods", "several foods"
+)
+
+# Every lexicon used by the scorer as (keyword, item) pairs. For "food" the
+# item is the category name; for all other lexicons it is the keyword itself.
+_LEXICON_PAIRS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "food": tuple(
+        (keyword, category)
+        for category, data in _FOOD_CATEGORIES.items()
+        for keyword in data["keywords"]
+    ),
+    "skin": tuple((kw, kw) for kw in _SYMPTOMS["skin_symptoms"]),
+    "immediate": tuple((kw, kw) for kw in _SYMPTOMS["immediate_reactions"]),
+    "elim": tuple((kw, kw) for kw in _ELIMINATION_KEYWORDS),
+    "safety": tuple((kw, kw) for kw in _SAFETY_KEYWORDS),
+    "gerd_sev": tuple((kw, kw) for kw in _GERD_SEVERITY_KEYWORDS),
+    "broad": tuple((kw, kw) for kw in _BROAD_SENSITIVITY_PHRASES),
+}
+
+
+def _keyword_payloads() -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Flat keyword -> (lexicon, item) index across all lexicons.
+
+    A keyword present in several lexicons or food categories (e.g. "hives",
+    "wheat") carries every (lexicon, item) pair as its payload.
+    """
+    payloads: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for lexicon, pairs in _LEXICON_PAIRS.items():
+        for keyword, item in pairs:
+            payloads[keyword].append((lexicon, item))
+    return payloads
+
+
+_KEYWORD_INDEX = _keyword_payloads()
+
+# Shortest needle across all lexicons ("gas", "ham", "rye"); shorter text cannot match
+_MIN_KEYWORD_LEN = min(map(len, _KEYWORD_INDEX))
+
+# Plural endings accepted between a keyword and its closing word boundary
+_PLURAL_SUFFIXES = ("", "s", "es")
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w class so automaton hits honour the same word boundaries."""
+    return char.isalnum() or char == '_'
+
+
+def _is_bounded(text: str, start: int, end: int) -> bool:
+    """
+    Check that text[start:end] is a whole word or phrase.
+
+    A plural "s"/"es" suffix is allowed before the closing boundary, so
+    "onions" and "tomatoes" still match "onion" and "tomato" while "gas"
+    no longer matches inside "garbage" or "pop" inside "population".
+    """
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    for suffix in _PLURAL_SUFFIXES:
+        if suffix and not text.startswith(suffix, end):
+            continue
+        after = end + len(suffix)
+        if after == len(text) or not _is_word_char(text[after]):
+            return True
+    return False
+
+
+def _occurs_bounded(keyword: str, text: str) -> bool:
+    """Check if keyword occurs in text on word boundaries (see _is_bounded)."""
+    start = text.find(keyword)
+    while start != -1:
+        if _is_bounded(text, start, start + len(keyword)):
+            return True
+        start = text.find(keyword, start + 1)
+    return False
+
+
+# One automaton over all lexicons so the text is traversed once; the payload
+# carries the keyword length so hits can be checked for word boundaries
+_TEXT_AUTOMATON = build_keyword_automaton(
+    (keyword, (len(keyword), tuple(payload))) for keyword, payload in _KEYWORD_INDEX.items()
+)
+
+# Regex fallback: one word-bounded alternation, longest keyword first, inside a
+# zero-width lookahead so every start position is tried. Only the longest
+# keyword at a position is reported (with the plural suffix it took), so each
+# (keyword, suffix) also carries the payloads of the keywords found on word
+# boundaries inside it ("bell pepper" implies "pepper", "peppers" implies
+# "pepper", but "peppermint" implies neither "pepper" nor "mint").
+_CONTAINED_PAYLOADS = {
+    (keyword, suffix): tuple({
+        entry
+        for other, payload in _KEYWORD_INDEX.items() if _occurs_bounded(other, keyword + suffix)
+        for entry in payload
+    })
+    for keyword in _KEYWORD_INDEX
+    for suffix in _PLURAL_SUFFIXES
+}
+_TEXT_RE = re.compile(
+    r"(?=\b(" + "|".join(
+        re.escape(keyword) for keyword in sorted(_KEYWORD_INDEX, key=len, reverse=True)
+    ) + r")(e?s)?\b)"
+)
+
+
+def _scan_text(text_lower: str) -> Dict[str, Set[str]]:
+    """
+    Collect word-bounded keyword hits per lexicon in a single pass over the text.
+
+    Returns:
+        Dict mapping lexicon name to the set of matched items
+    """
+    hits: Dict[str, Set[str]] = {lexicon: set() for lexicon in _LEXICON_PAIRS}
+
+    if _TEXT_AUTOMATON is not None:
+        for end, (length, payload) in _TEXT_AUTOMATON.iter(text_lower):
+            if not _is_bounded(text_lower, end - length + 1, end + 1):
+                continue
+            for lexicon, item in payload:
+                hits[lexicon].add(item)
+        return hits
+
+    # Fallback when pyahocorasick is not installed
+    for match in _TEXT_RE.findall(text_lower):
+        for lexicon, item in _CONTAINED_PAYLOADS[match]:
+            hits[lexicon].add(item)
+    return hits
+
+
+# Per-domain caps for this field
+_DOMAIN_CAPS = {
+    "GA": 1.5,
+    "IMM": 0.6,
+    "SKN": 0.3,
+    "STR": 0.1
+}
+
+# Scoring terms per food category, flattened once so the scoring loop does no
+# dict lookups: (category, bit, ((domain, score, cap), ...), skin_boost).
+# Matched categories are accumulated as an int bitset and only turned into
+# names for the flag.
+_CATEGORY_TERMS: Tuple[Tuple[str, int, Tuple[Tuple[str, float, float], ...], float], ...] = tuple(
+    (
+        category,
+        1 << index,
+        tuple((domain, score, _DOMAIN_CAPS[domain]) for domain, score in data["scores"].items()),
+        data.get("skin_boost", 0.0)
+    )
+    for index, (category, data) in enumerate(_FOOD_CATEGORIES.items())
+)
+_CATEGORY_BITS: Tuple[Tuple[int, str], ...] = tuple(
+    (bit, category) for category, bit, _, _ in _CATEGORY_TERMS
+)
+
+
+# Typo-tolerant second pass (RapidFuzz + wordfreq). A misspelling must be as
+# long as a 5+ character keyword give or take one letter, start with the same
+# letter and be one edit away (a swap of adjacent letters counts as one).
+# Shorter keywords ("ham", "pop", "wine") sit within one edit of too many
+# everyday words.
+_FUZZY_MIN_KEYWORD_LEN = 5
+_FUZZY_MAX_EDITS = 1
+
+# Only phrases with at least one word rarer than this (wordfreq Zipf scale) are
+# fuzzy-matched. Real words one edit from a food ("daisy", "baton", "better")
+# are at or above it; misspellings ("lactoze", "brocoli", "garlick") fall below.
+_FUZZY_MAX_WORD_ZIPF = 2.5
+
+
+@lru_cache(maxsize=4096)
+def _is_english_word(word: str) -> bool:
+    """Whether `word` is a common enough English word to never be read as a misspelling."""
+    from wordfreq import zipf_frequency
+
+    return zipf_frequency(word, "en") >= _FUZZY_MAX_WORD_ZIPF
+
+
+def _build_fuzzy_keywords() -> Dict[Tuple[int, str], List[Tuple[str, Tuple[str, ...]]]]:
+    """
+    Food keywords of 5+ characters, each once with every category it belongs to
+    ("wheat", "tomato", "eggplant" are shared), keyed by (word count, first letter).
+    """
+    fuzzy_keywords: Dict[Tuple[int, str], List[Tuple[str, Tuple[str, ...]]]] = defaultdict(list)
+    for keyword, payload in _KEYWORD_INDEX.items():
+        if len(keyword) >= _FUZZY_MIN_KEYWORD_LEN and any(lexicon == "food" for lexicon, _ in payload):
+            fuzzy_keywords[(len(keyword.split()), keyword[0])].append(
+                (keyword, tuple(item for lexicon, item in payload if lexicon == "food"))
+            )
+    return dict(fuzzy_keywords)
+
+
+_FUZZY_KEYWORDS = _build_fuzzy_keywords()
+_FUZZY_WORD_COUNTS: Tuple[int, ...] = tuple(sorted({word_count for word_count, _ in _FUZZY_KEYWORDS}))
+
+# Punctuation is stripped before fuzzy matching so "lactoze," still lines up with "lactose"
+_FUZZY_PUNCT_RE = re.compile(r"[^\w\s]+")
+
+
+def _fuzzy_food_categories(text_lower: str, matched: Set[str]) -> Set[str]:
+    """
+    Find food categories missed by exact matching because of misspellings.
+
+    Only categories not already in `matched` are checked, so the common case
+    of correctly spelled foods costs nothing extra.
+
+    Args:
+        text_lower: Lowercased followup text
+        matched: Categories already found by the exact scan
+
+    Returns:
+        Set of additional categories matched fuzzily (empty without rapidfuzz or wordfreq)
+    """
+    if not (RAPIDFUZZ_AVAILABLE and WORDFREQ_AVAILABLE) or len(matched) == len(_FOOD_CATEGORIES):
+        return set()
+
+    from rapidfuzz.distance import OSA
+
+    words = _FUZZY_PUNCT_RE.sub(" ", text_lower).split()
+    found: Set[str] = set()
+    for word_count in _FUZZY_WORD_COUNTS:
+        for start in range(len(words) - word_count + 1):
+            phrase_words = words[start:start + word_count]
+            phrase = " ".join(phrase_words)
+            # Exact keywords ("pepper") are not re-matched against their neighbours ("peppers")
+            if len(phrase) < _FUZZY_MIN_KEYWORD_LEN or phrase in _KEYWORD_INDEX:
+                continue
+            for keyword, categories in _FUZZY_KEYWORDS.get((word_count, phrase[0]), ()):
+                if abs(len(keyword) - len(phrase)) > _FUZZY_MAX_EDITS:
+                    continue
+                if all(category in matched or category in found for category in categories):
+                    continue
+                if OSA.distance(phrase, keyword, score_cutoff=_FUZZY_MAX_EDITS) > _FUZZY_MAX_EDITS:
+                    continue
+                # A phrase made only of real words ("daisy", "baton") is not a misspelling
+                if all(_is_english_word(word) for word in phrase_words):
+                    break
+                found.update(category for category in categories if category not in matched)
+    return found
+
 
 class FoodAvoidanceRuleset:
     """
     Ruleset for scoring foods avoided due to symptoms.
-    
+
     Detects 7 main categories:
     1. Gluten/wheat
     2. Lactose/dairy
@@ -31,7 +394,7 @@ class FoodAvoidanceRuleset:
     5. GERD-promoting foods
     6. Nightshades
     7. Broad sensitivities (≥4 distinct foods)
-    
+
     Features:
     - NLP-based keyword matching with lemmatization + fuzzy matching
     - Symptom linking (bloating, reflux, hives, etc.)
@@ -39,186 +402,52 @@ class FoodAvoidanceRuleset:
     - Elimination response detection (confidence boost)
     - Per-domain caps
     """
-    
+
     # Per-domain caps for this field
-    DOMAIN_CAPS = {
-        "GA": 1.5,
-        "IMM": 0.6,
-        "SKN": 0.3,
-        "STR": 0.1
-    }
-    
+    DOMAIN_CAPS = _DOMAIN_CAPS
+
+    # Lexicons are shared class-level state, built once at import
+    food_categories = _FOOD_CATEGORIES
+    symptoms = _SYMPTOMS
+    elimination_keywords = _ELIMINATION_KEYWORDS
+
     # Safety keywords (immediate reactions)
-    SAFETY_KEYWORDS = [
-        "anaphylaxis", "throat closing", "throat swelling", "can't breathe",
-        "angioedema", "severe hives", "epipen", "emergency"
-    ]
-    
-    def __init__(self):
-        """Initialize the ruleset with NLP model and food category lexicons."""
-        self.nlp = get_spacy_model()
-        self._build_food_lexicons()
-        self._build_symptom_lexicons()
-    
-    def _build_food_lexicons(self):
-        """
-        Build food category lexicons with keywords and base weights.
-        
-        Structure: {
-            "category_name": {
-                "keywords": [...],
-                "scores": {"GA": 0.45, ...},
-                "skin_boost": 0.10  # Optional SKN boost if skin symptoms present
-            }
-        }
-        """
-        self.food_categories = {
-            # 1) Gluten/wheat
-            "gluten_wheat": {
-                "keywords": [
-                    "gluten", "wheat", "bread", "pasta", "cereal", "flour",
-                    "barley", "rye", "malt", "seitan", "couscous", "semolina"
-                ],
-                "scores": {"GA": 0.45, "IMM": 0.15},
-                "skin_boost": 0.10
-            },
-            
-            # 2) Lactose/dairy
-            "lactose_dairy": {
-                "keywords": [
-                    "milk", "dairy", "lactose", "ice cream", "cheese", "yogurt",
-                    "cream", "butter", "whey", "casein", "kefir"
-                ],
-                "scores": {"GA": 0.35, "IMM": 0.10},
-                "skin_boost": 0.15
-            },
-            
-            # 3) High-FODMAP foods
-            "high_fodmap": {
-                "keywords": [
-                    "garlic", "onion", "beans", "lentils", "chickpeas",
-                    "apples", "pears", "stone fruit", "peaches", "plums",
-                    "cauliflower", "broccoli", "cabbage", "brussels sprouts",
-                    "wheat", "rye", "honey", "agave", "high fructose"
-                ],
-                "scores": {"GA": 0.35, "IMM": 0.10},
-                "skin_boost": 0.0
-            },
-            
-            # 4) Histamine-rich foods
-            "histamine_rich": {
-                "keywords": [
-                    "aged cheese", "wine", "beer", "alcohol", "cured meat",
-                    "salami", "pepperoni", "bacon", "ham", "sausage",
-                    "vinegar", "kombucha", "fermented", "sauerkraut", "kimchi",
-                    "leftovers", "tinned fish", "canned fish", "tuna", "sardines",
-                    "tomato", "spinach", "eggplant", "avocado", "banana"
-                ],
-                "scores": {"GA": 0.35, "IMM": 0.20},
-                "skin_boost": 0.15
-            },
-            
-            # 5) GERD-promoting foods
-            "gerd_triggers": {
-                "keywords": [
-                    "spicy", "chili", "hot sauce", "capsaicin", "pepper",
-                    "fried", "fatty", "greasy", "oily",
-                    "large meal", "late meal", "eating late", "late night",
-                    "carbonated", "soda", "pop", "fizzy", "sparkling",
-                    "acidic", "citrus", "orange", "lemon", "grapefruit",
-                    "coffee", "caffeine", "chocolate", "mint", "peppermint"
-                ],
-                "scores": {"GA": 0.20, "STR": 0.05},
-                "skin_boost": 0.0
-            },
-            
-            # 6) Nightshades
-            "nightshades": {
-                "keywords": [
-                    "nightshade", "tomato", "potato", "bell pepper", "peppers",
-                    "eggplant", "aubergine", "goji", "paprika"
-                ],
-                "scores": {"GA": 0.10, "IMM": 0.10},
-                "skin_boost": 0.10
-            }
-        }
-
-    def _build_symptom_lexicons(self):
-        """Build symptom keyword lists for linking foods to symptoms."""
-        self.symptoms = {
-            "gi_symptoms": [
-                "bloating", "gas", "cramps", "cramping", "diarrhea", "loose stool",
-                "constipation", "nausea", "vomiting", "reflux", "heartburn",
-                "acid", "burning", "indigestion", "upset stomach", "pain"
-            ],
-            "skin_symptoms": [
-                "rash", "hives", "eczema", "psoriasis", "acne", "breakout",
-                "itchy", "itching", "flush", "flushing", "red", "redness"
-            ],
-            "neuro_symptoms": [
-                "headache", "migraine", "brain fog", "foggy", "dizzy", "fatigue"
-            ],
-            "immediate_reactions": [
-                "hives", "angioedema", "anaphylaxis", "throat closing",
-                "swelling", "epipen", "emergency"
-            ]
-        }
-
-        self.elimination_keywords = [
-            "removing", "removed", "stopped", "quit", "avoiding", "eliminated",
-            "fixed", "helped", "better", "improved", "resolved"
-        ]
+    SAFETY_KEYWORDS = _SAFETY_KEYWORDS
 
-    def _detect_safety_flags(self, text: str) -> List[str]:
-        """Detect safety keywords that require immediate attention."""
-        text_lower = text.lower()
-        flags = []
+    # GERD severity modifiers (late/large meals, carbonated drinks)
+    GERD_SEVERITY_KEYWORDS = _GERD_SEVERITY_KEYWORDS
 
-        for keyword in self.SAFETY_KEYWORDS:
-            if keyword in text_lower:
-                flags.append(f"SAFETY: {keyword}")
+    # Phrases that trigger the broad sensitivities rule on their own
+    BROAD_SENSITIVITY_PHRASES = _BROAD_SENSITIVITY_PHRASES
 
-        return flags
+    @cached_property
+    def nlp(self):
+        """Shared spaCy model, loaded on first access (keyword scoring does not need it)."""
+        return get_spacy_model()
+
+    def _detect_safety_flags(self, hits: Dict[str, Set[str]]) -> List[str]:
+        """Detect safety keywords that require immediate attention."""
+        safety_hits = hits["safety"]
+        if not safety_hits:
+            return []
 
-    def _detect_skin_symptoms(self, text: str) -> bool:
+        # Report hits in SAFETY_KEYWORDS order, once each
+        return [f"SAFETY: {keyword}" for keyword in self.SAFETY_KEYWORDS if keyword in safety_hits]
+
+    def _detect_skin_symptoms(self, hits: Dict[str, Set[str]]) -> bool:
         """Check if text mentions skin-related symptoms."""
-        text_lower = text.lower()
-        return any(symptom in text_lower for symptom in self.symptoms["skin_symptoms"])
+        return bool(hits["skin"])
 
-    def _detect_elimination_response(self, text: str) -> bool:
+    def _detect_elimination_response(self, hits: Dict[str, Set[str]]) -> bool:
         """Check if user reports improvement after eliminating foods."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.elimination_keywords)
+        return bool(hits["elim"])
 
-    def _count_distinct_foods(self, text: str) -> int:
+    def _count_distinct_foods(self, hits: Dict[str, Set[str]]) -> int:
         """
         Count distinct food groups mentioned.
         Used for "broad sensitivities" rule (≥4 foods).
         """
-        text_lower = text.lower()
-        food_groups_found = set()
-
-        # Check each category
-        for category, data in self.food_categories.items():
-            for keyword in data["keywords"]:
-                if keyword in text_lower:
-                    food_groups_found.add(category)
-                    break
-
-        return len(food_groups_found)
-
-    def _detect_gerd_severity(self, text: str) -> float:
-        """
-        Detect GERD severity modifiers.
-        Returns multiplier for GERD scores (1.0 to 1.25).
-        """
-        text_lower = text.lower()
-
-        # Check for late/large meals or carbonated drinks (higher GA score)
-        if any(kw in text_lower for kw in ["late meal", "late night", "eating late", "large meal", "big meal", "carbonated", "soda"]):
-            return 1.25  # GA +0.25 instead of +0.20
-
-        return 1.0  # Base GA +0.20
+        return len(hits["food"])
 
     def get_food_avoidance_weights(
         self,
@@ -237,104 +466,268 @@ class FoodAvoidanceRuleset:
             - weights: Dict mapping focus area codes to weight adjustments
             - flags: List of safety flags or special notes
         """
-        # Initialize
-        weights = defaultdict(float)
-        flags = []
-
         # Age gating (adults only)
         if age is not None and age < 18:
-            return dict(weights), flags
+            return {}, []
 
         # Parse Yes/No with followup
         is_yes, followup_text = parse_yes_no_with_followup(avoidance_data)
 
         if not is_yes or not followup_text:
-            return dict(weights), flags
+            return {}, []
+
+        # Normalize text once (followup is already stripped and non-empty);
+        # every detector below works off the same lowercased string
+        text_lower = followup_text.lower()
+
+        # Too short to contain any keyword: nothing to scan or score
+        if len(text_lower) < _MIN_KEYWORD_LEN:
+            return dict.fromkeys(self.DOMAIN_CAPS, 0.0), []
+
+        # Scoring is a pure function of the normalized text, so repeated answers hit the cache
+        weights, flags = _cached_food_avoidance_weights(text_lower)
+        return dict(weights), list(flags)
+
+    def _score_text(self, text_lower: str) -> Tuple[Dict[str, float], List[str]]:
+        """
+        Score normalized, non-empty followup text (uncached).
 
-        # Normalize text
-        text_lower = followup_text.lower().strip()
+        Args:
+            text_lower: Lowercased, stripped followup text
+
+        Returns:
+            Tuple of (weights dict, flags list)
+        """
+        # Every domain this field can touch, preallocated (no defaultdict growth).
+        # Domain caps are applied inline at each update; every update only raises a
+        # weight (or lowers it toward 0.60), so this equals capping once at the end.
+        weights = {"GA": 0.0, "IMM": 0.0, "SKN": 0.0, "STR": 0.0}
+        caps = self.DOMAIN_CAPS
 
-        if not text_lower:
-            return dict(weights), flags
+        # Single pass over the text for every lexicon
+        hits = _scan_text(text_lower)
+        found_categories = hits["food"]
 
-        # Check for safety flags
-        safety_flags = self._detect_safety_flags(text_lower)
-        flags.extend(safety_flags)
+        # Second pass for misspelled foods ("lactoze", "glueten") in unmatched categories
+        found_categories.update(_fuzzy_food_categories(text_lower, found_categories))
 
         # Detect skin symptoms (for SKN boost)
-        has_skin_symptoms = self._detect_skin_symptoms(text_lower)
+        has_skin_symptoms = self._detect_skin_symptoms(hits)
 
         # Detect elimination response (for confidence boost)
-        has_elimination_response = self._detect_elimination_response(text_lower)
+        has_elimination_response = self._detect_elimination_response(hits)
 
         # Count distinct foods (for broad sensitivities rule)
-        distinct_food_count = self._count_distinct_foods(text_lower)
+        distinct_food_count = self._count_distinct_foods(hits)
 
-        # Track matched categories for explainability
-        matched_categories = []
+        # GERD severity modifier: late/large meals or carbonated drinks
+        # (matched in the same scan) raise GERD-trigger GA from +0.20 to +0.25
+        has_gerd_severity = bool(hits["gerd_sev"])
+        skn_cap = caps["SKN"]
 
-        # ===== SCORE EACH FOOD CATEGORY =====
-        for category, data in self.food_categories.items():
-            category_matched = False
-
-            # Check if any keyword matches
-            for keyword in data["keywords"]:
-                if keyword in text_lower:
-                    category_matched = True
-                    break
+        # Track matched categories for explainability (one bit per category)
+        matched_mask = 0
 
-            if not category_matched:
+        # ===== SCORE EACH FOOD CATEGORY =====
+        for category, bit, scores, skin_boost in _CATEGORY_TERMS:
+            if category not in found_categories:
                 continue
 
-            matched_categories.append(category)
+            matched_mask |= bit
 
             # Apply base scores
-            for domain, score in data["scores"].items():
-                weights[domain] += score
+            for domain, score, cap in scores:
+                weights[domain] = min(weights[domain] + score, cap)
 
             # Apply skin boost if skin symptoms mentioned
-            if has_skin_symptoms and data.get("skin_boost", 0) > 0:
-                weights["SKN"] += data["skin_boost"]
+            if has_skin_symptoms and skin_boost > 0:
+                weights["SKN"] = min(weights["SKN"] + skin_boost, skn_cap)
 
-            # Special handling for GERD triggers (severity modifier)
-            if category == "gerd_triggers":
-                gerd_multiplier = self._detect_gerd_severity(text_lower)
-                if gerd_multiplier > 1.0:
-                    # Adjust GA score from +0.20 to +0.25
-                    weights["GA"] += 0.05
+            if has_gerd_severity and category == "gerd_triggers":
+                weights["GA"] = min(weights["GA"] + 0.05, caps["GA"])
 
         # ===== BROAD SENSITIVITIES RULE =====
         # If ≥4 distinct food groups OR user says "many foods"
-        if distinct_food_count >= 4 or any(phrase in text_lower for phrase in ["many foods", "lots of foods", "multiple foods", "several foods"]):
-            weights["GA"] += 0.45
-            weights["IMM"] += 0.30
-            weights["SKN"] += 0.20
-            flags.append("Broad sensitivities detected (≥4 food groups)")
+        is_broad = distinct_food_count >= 4 or bool(hits["broad"])
+        if is_broad:
+            weights["GA"] = min(weights["GA"] + 0.45, caps["GA"])
+            weights["IMM"] = min(weights["IMM"] + 0.30, caps["IMM"])
+            weights["SKN"] = min(weights["SKN"] + 0.20, caps["SKN"])
 
         # ===== ELIMINATION RESPONSE BOOST =====
         # If user reports improvement after eliminating foods, boost confidence
         if has_elimination_response:
             # Multiply GA/IMM/SKN weights by 1.1× (cap per-item at +0.60)
-            for domain in ["GA", "IMM", "SKN"]:
+            for domain in ("GA", "IMM", "SKN"):
                 if weights[domain] > 0:
-                    weights[domain] = min(weights[domain] * 1.1, 0.60)
-            flags.append("Elimination response reported")
+                    weights[domain] = min(weights[domain] * 1.1, 0.60, caps[domain])
 
         # ===== IMMEDIATE REACTIONS (SAFETY + SCORING) =====
         # Check for immediate/severe reactions
-        if any(kw in text_lower for kw in self.symptoms["immediate_reactions"]):
-            weights["IMM"] += 0.60
-            weights["SKN"] += 0.30
-            flags.append("SAFETY: Immediate/severe reaction reported")
+        if hits["immediate"]:
+            weights["IMM"] = min(weights["IMM"] + 0.60, caps["IMM"])
+            weights["SKN"] = min(weights["SKN"] + 0.30, caps["SKN"])
+
+        return weights, self._collect_flags(hits, matched_mask, is_broad)
 
-        # ===== APPLY DOMAIN CAPS =====
-        for domain, cap in self.DOMAIN_CAPS.items():
-            if weights[domain] > cap:
-                weights[domain] = cap
+    def _collect_flags(
+        self,
+        hits: Dict[str, Set[str]],
+        matched_mask: int,
+        is_broad: bool
+    ) -> List[str]:
+        """
+        Build the flags list for one answer (shared by scalar and batch scoring).
+
+        Args:
+            hits: Per-lexicon hits from _scan_text
+            matched_mask: Bitset of matched food categories (see _CATEGORY_BITS)
+            is_broad: Whether the broad sensitivities rule fired
+
+        Returns:
+            Safety flags first, then rule notes, then the explainability note
+        """
+        flags = self._detect_safety_flags(hits)
+
+        if is_broad:
+            flags.append("Broad sensitivities detected (≥4 food groups)")
+
+        if self._detect_elimination_response(hits):
+            flags.append("Elimination response reported")
+
+        if hits["immediate"]:
+            flags.append("SAFETY: Immediate/severe reaction reported")
 
         # Add explainability note
-        if matched_categories:
-            flags.append(f"Detected: {', '.join(matched_categories)}")
+        if matched_mask:
+            flags.append(
+                "Detected: " + ", ".join(category for bit, category in _CATEGORY_BITS if matched_mask & bit)
+            )
 
-        return dict(weights), flags
+        return flags
+
+    def get_food_avoidance_weights_batch(
+        self,
+        avoidance_data: Any,
+        ages: Any = None
+    ) -> Tuple[Dict[str, "np.ndarray"], List[List[str]]]:
+        """
+        Vectorized version of get_food_avoidance_weights for many patients at once.
+
+        Each distinct followup text is scanned once; the per-row lexicon hits
+        form a membership matrix and the category scoring, boosts and caps run
+        as array operations over all rows.
+
+        Args:
+            avoidance_data: Iterable of Yes/No + followup answers (one per patient)
+            ages: Optional array-like of ages (rows with age < 18 get no weights)
 
+        Returns:
+            Tuple of (weights, flags)
+            - weights: Dict mapping focus area → float array (one weight per patient)
+            - flags: One flags list per patient, as from the scalar method
+        """
+        import numpy as np
+
+        (category_scores, category_bit_vector, category_skin_boost,
+         broad_bonus, immediate_bonus, domain_cap_vector) = _batch_arrays()
+
+        records = list(avoidance_data)
+        n = len(records)
+        age = np.broadcast_to(np.asarray(ages if ages is not None else np.nan, dtype=float), (n,))
+
+        # Parse + normalize each row (None = no scoring for this row)
+        texts: List[Any] = []
+        for record, row_age in zip(records, age):
+            if row_age < 18:
+                texts.append(None)
+                continue
+            is_yes, followup_text = parse_yes_no_with_followup(record)
+            texts.append(followup_text.lower() if is_yes and followup_text else None)
+
+        # Scan each distinct text once
+        scans: Dict[str, Dict[str, Set[str]]] = {}
+        for text_lower in texts:
+            if text_lower is not None and text_lower not in scans:
+                hits = _scan_text(text_lower)
+                hits["food"].update(_fuzzy_food_categories(text_lower, hits["food"]))
+                scans[text_lower] = hits
+
+        # Membership matrix: rows = patients, columns = food categories (+ rule lexicons)
+        category_mask: np.ndarray = np.zeros((n, len(_CATEGORY_NAMES)), dtype=bool)
+        rule_mask: np.ndarray = np.zeros((n, len(_RULE_LEXICONS)), dtype=bool)
+        for row, text_lower in enumerate(texts):
+            if text_lower is None:
+                continue
+            hits = scans[text_lower]
+            category_mask[row] = [category in hits["food"] for category in _CATEGORY_NAMES]
+            rule_mask[row] = [bool(hits[lexicon]) for lexicon in _RULE_LEXICONS]
+        has_skin, has_elimination, has_immediate, has_gerd_severity, has_broad_phrase = rule_mask.T
+
+        # Base scores + skin boost + GERD severity bonus
+        weights = category_mask @ category_scores
+        weights[:, _SKN] += (category_mask & has_skin[:, None]) @ category_skin_boost
+        weights[:, _GA] += 0.05 * (category_mask[:, _GERD_CATEGORY] & has_gerd_severity)
+
+        # Broad sensitivities (≥4 groups or explicit phrase)
+        is_broad = (category_mask.sum(axis=1) >= 4) | has_broad_phrase
+        weights[is_broad] += broad_bonus
+
+        # Elimination response: GA/IMM/SKN × 1.1, capped at 0.60, only where positive
+        boosted = weights[:, _ELIMINATION_COLUMNS]
+        weights[:, _ELIMINATION_COLUMNS] = np.where(
+            has_elimination[:, None] & (boosted > 0), np.minimum(boosted * 1.1, 0.60), boosted
+        )
+
+        # Immediate reactions, then per-domain caps
+        weights[has_immediate] += immediate_bonus
+        np.minimum(weights, domain_cap_vector, out=weights)
+
+        category_bits = category_mask @ category_bit_vector
+        flags = [
+            self._collect_flags(
+                scans[text_lower],
+                int(category_bits[row]),
+                bool(is_broad[row])
+            ) if text_lower is not None else []
+            for row, text_lower in enumerate(texts)
+        ]
+
+        return {fa: weights[:, col] for col, fa in enumerate(_FOCUS_AREAS)}, flags
+
+
+# Array layout for batch scoring: columns follow DOMAIN_CAPS, rows follow _FOOD_CATEGORIES
+_FOCUS_AREAS = tuple(FoodAvoidanceRuleset.DOMAIN_CAPS)
+_GA, _IMM, _SKN = (_FOCUS_AREAS.index(fa) for fa in ("GA", "IMM", "SKN"))
+_CATEGORY_NAMES = tuple(_FOOD_CATEGORIES)
+_GERD_CATEGORY = _CATEGORY_NAMES.index("gerd_triggers")
+_RULE_LEXICONS = ("skin", "elim", "immediate", "gerd_sev", "broad")
+_ELIMINATION_COLUMNS = [_GA, _IMM, _SKN]
+
+
+@lru_cache(maxsize=None)
+def _batch_arrays() -> Tuple["np.ndarray", ...]:
+    """
+    Build the batch scoring arrays on first use, so numpy is only imported by the batch path.
+
+    Returns (category scores, category bits, skin boosts, broad bonus, immediate bonus, domain caps).
+    """
+    import numpy as np
+
+    return (
+        np.array([[data["scores"].get(fa, 0.0) for fa in _FOCUS_AREAS] for data in _FOOD_CATEGORIES.values()]),
+        np.array([bit for bit, _ in _CATEGORY_BITS], dtype=np.int64),
+        np.array([data.get("skin_boost", 0.0) for data in _FOOD_CATEGORIES.values()]),
+        np.array([{"GA": 0.45, "IMM": 0.30, "SKN": 0.20}.get(fa, 0.0) for fa in _FOCUS_AREAS]),
+        np.array([{"IMM": 0.60, "SKN": 0.30}.get(fa, 0.0) for fa in _FOCUS_AREAS]),
+        np.array([FoodAvoidanceRuleset.DOMAIN_CAPS[fa] for fa in _FOCUS_AREAS]),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_food_avoidance_weights(
+    text_lower: str
+) -> Tuple[Tuple[Tuple[str, float], ...], Tuple[str, ...]]:
+    """Memoized scoring keyed on the normalized followup text; returns immutable copies of the result."""
+    weights, flags = FoodAvoidanceRuleset()._score_text(text_lower)
+    return tuple(weights.items()), tuple(flags)
@@ -2,14 +2,28 @@
 Food Cravings Ruleset (Field 18) - Phase 3
 
 Evaluates food cravings patterns and their impact on focus areas.
-Uses simple substring matching on normalized multi-select input.
+Uses substring matching on normalized multi-select input; every keyword is
+matched in one Aho-Corasick pass per text.
 
 UI: Multi-select chips — Sweets · Salty · Bread/Pasta · Chocolate · Caffeine · None/NO/NA · Other (short text)
 """
 
-from typing import Dict, List, Tuple, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple, Any
 import re
 
+from .constants import build_keyword_automaton
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Multi-select separators → spaces, in one translate pass
+_SEP_TRANS = str.maketrans(";,", "  ")
+
+# Answers that mean "no cravings" on their own
+_EMPTY_SENTINELS = frozenset({"", "none", "no", "na"})
+
 
 class FoodCravingsRuleset:
     """
@@ -105,6 +119,9 @@ class FoodCravingsRuleset:
     DIZZINESS_KEYWORDS = ["dizzy", "dizziness", "lightheaded", "standing up"]
     LOW_BP_KEYWORDS = ["low blood pressure", "low bp", "hypotension"]
     POST_MEAL_CRASH_KEYWORDS = ["crash", "sleepy after eating", "tired after meal", "energy dip"]
+    HEAVY_CAFFEINE_TERMS = [">3 cups", "3+ cups", "to function", "to get going"]
+    PMS_TERMS = ["pms", "pre-menstrual", "premenstrual", "luteal", "before period"]
+    FEMALE_VALUES = frozenset({"female", "f", "woman"})
     
     def __init__(self):
         pass
@@ -114,74 +131,66 @@ class FoodCravingsRuleset:
         if not text:
             return ""
         
-        # Lowercase
-        text = text.lower()
-        
-        # Replace semicolons and commas with spaces for splitting
-        text = text.replace(";", " ").replace(",", " ")
-        
-        return text.strip()
+        # Lowercase; replace semicolons and commas with spaces for splitting
+        return text.lower().translate(_SEP_TRANS).strip()
     
-    def _detect_frequency_multiplier(self, text: str) -> float:
+    def _detect_frequency_multiplier(self, matched: FrozenSet[str]) -> float:
         """
         Detect frequency terms and return intensity multiplier.
         
+        Args:
+            matched: Keyword buckets found in the normalized text (see _scan_keywords)
+        
         Returns:
             1.5 for high frequency
             1.25 for moderate frequency
             1.0 for low/no frequency terms
         """
-        text_lower = text.lower()
-        
         # Check high frequency
-        for term in self.HIGH_FREQUENCY_TERMS:
-            if term in text_lower:
-                return 1.5
+        if "high_frequency" in matched:
+            return 1.5
         
         # Check moderate frequency
-        for term in self.MODERATE_FREQUENCY_TERMS:
-            if term in text_lower:
-                return 1.25
+        if "moderate_frequency" in matched:
+            return 1.25
         
         # Low frequency or no frequency terms
         return 1.0
 
-    def _parse_other_text(self, text: str) -> Dict[str, float]:
+    def _parse_other_text(self, matched: FrozenSet[str]) -> Dict[str, float]:
         """
         Parse "Other" free text and map to known categories.
 
+        Args:
+            matched: Keyword buckets found in the "Other" text (see _scan_keywords)
+
         Returns:
             Dict of focus area weights from "Other" text
         """
         weights = {}
-        text_lower = text.lower()
 
-        # Check for alcohol
-        if any(kw in text_lower for kw in self.ALCOHOL_KEYWORDS):
-            for domain, weight in self.OTHER_LEXICON["alcohol"].items():
-                weights[domain] = weights.get(domain, 0) + weight
+        # Alcohol, energy drinks, fast food, ultra-processed foods, late-night snacking
+        for category in _OTHER_CATEGORIES:
+            if category in matched:
+                for domain, weight in self.OTHER_LEXICON[category].items():
+                    weights[domain] = weights.get(domain, 0) + weight
 
-        # Check for energy drinks
-        if any(kw in text_lower for kw in self.ENERGY_DRINK_KEYWORDS):
-            for domain, weight in self.OTHER_LEXICON["energy_drink"].items():
-                weights[domain] = weights.get(domain, 0) + weight
-
-        # Check for fast food
-        if any(kw in text_lower for kw in self.FAST_FOOD_KEYWORDS):
-            for domain, weight in self.OTHER_LEXICON["fast_food"].items():
-                weights[domain] = weights.get(domain, 0) + weight
+        return weights
 
-        # Check for ultra-processed foods
-        if any(kw in text_lower for kw in self.UPF_KEYWORDS):
-            for domain, weight in self.OTHER_LEXICON["ultra_processed"].items():
-                weights[domain] = weights.get(domain, 0) + weight
+    def _classify_cravings(self, cravings_data: Any) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+        """
+        Match the multi-select answer against every keyword bucket.
 
-        # Check for late-night snacking
-        if any(kw in text_lower for kw in self.LATE_NIGHT_KEYWORDS):
-            for domain, weight in self.OTHER_LEXICON["late_night"].items():
-                weights[domain] = weights.get(domain, 0) + weight
+        Returns:
+            None when nothing should be scored (empty or "None"-only answer),
+            else (buckets in the answer, buckets in its "Other" free text)
+        """
+        # Handle None or empty input (the common "no cravings" answer) before any scanning
+        if not cravings_data or str(cravings_data).strip().lower() in _EMPTY_SENTINELS:
+            return None
 
-        return weights
+        # Normalize text
+        return _classify_text(self._normalize_text(str(cravings_data)))
 
     def get_food_cravings_weights(
         self,
@@ -209,97 +218,380 @@ class FoodCravingsRuleset:
         weights = {}
         flags = []
 
-        # Handle None or empty input
-        if not cravings_data or cravings_data in ["", "None", "NO", "NA", "none", "no", "na"]:
+        classified = self._classify_cravings(cravings_data)
+        if classified is None:
             return (weights, flags)
+        matched, other_matched = classified
 
-        # Normalize text
-        text = self._normalize_text(str(cravings_data))
-
-        # Check if "None" is selected with other items → drop None
-        has_none = any(term in text for term in ["none", "no", "na"])
-        has_other_items = any(term in text for term in ["sweets", "salty", "bread", "pasta", "chocolate", "caffeine", "other"])
-
-        if has_none and has_other_items:
-            # Drop "None" - user selected both None and actual cravings
-            text = text.replace("none", "").replace("no", "").replace("na", "")
-        elif has_none and not has_other_items:
-            # Only "None" selected → no scoring
-            return (weights, flags)
+        # Symptom keywords come from a separate text, matched in their own pass
+        symptoms_matched = _scan_keywords(other_symptoms.lower()) if other_symptoms else _NO_MATCHES
 
         # Detect frequency multiplier from entire text
-        frequency_multiplier = self._detect_frequency_multiplier(text)
+        frequency_multiplier = self._detect_frequency_multiplier(matched)
+
+        # Running per-domain totals, indexed like _DOMAIN_NAMES
+        totals = [0.0] * len(_DOMAIN_NAMES)
+        craving_terms = _SCALED_CRAVING_TERMS[frequency_multiplier]
 
         # A) Sweets
-        if "sweets" in text or "sweet" in text:
-            for domain, weight in self.CRAVING_WEIGHTS["sweets"].items():
-                weights[domain] = weights.get(domain, 0) + (weight * frequency_multiplier)
+        if "sweet" in matched:
+            for index, weight in craving_terms["sweets"]:
+                totals[index] += weight
 
             # Amplifier: If sleep <6h or irregular → add STR +0.10
             if (sleep_hours is not None and sleep_hours < 6) or sleep_irregular:
-                weights["STR"] = weights.get("STR", 0) + 0.10
+                totals[_STR] += 0.10
 
         # B) Bread/Pasta
-        if "bread" in text or "pasta" in text:
-            for domain, weight in self.CRAVING_WEIGHTS["bread_pasta"].items():
-                weights[domain] = weights.get(domain, 0) + (weight * frequency_multiplier)
+        if "bread_pasta" in matched:
+            for index, weight in craving_terms["bread_pasta"]:
+                totals[index] += weight
 
             # If post-meal crash mentioned → add CM +0.10
-            if other_symptoms:
-                other_lower = other_symptoms.lower()
-                if any(kw in other_lower for kw in self.POST_MEAL_CRASH_KEYWORDS):
-                    weights["CM"] = weights.get("CM", 0) + 0.10
+            if "post_meal_crash" in symptoms_matched:
+                totals[_CM] += 0.10
 
         # C) Chocolate
-        if "chocolate" in text:
-            for domain, weight in self.CRAVING_WEIGHTS["chocolate"].items():
-                weights[domain] = weights.get(domain, 0) + (weight * frequency_multiplier)
+        if "chocolate" in matched:
+            for index, weight in craving_terms["chocolate"]:
+                totals[index] += weight
 
             # Women with cyclical/PMS pattern → HRM +0.20
-            if sex and sex.lower() in ["female", "f", "woman"]:
-                if menstrual_pattern:
-                    pattern_lower = menstrual_pattern.lower()
-                    if any(term in pattern_lower for term in ["pms", "pre-menstrual", "premenstrual", "luteal", "before period"]):
-                        weights["HRM"] = weights.get("HRM", 0) + 0.20
+            if sex and sex.lower() in self.FEMALE_VALUES:
+                if menstrual_pattern and "cyclical" in _scan_keywords(menstrual_pattern.lower()):
+                    totals[_HRM] += 0.20
 
         # D) Caffeine
-        if "caffeine" in text:
-            for domain, weight in self.CRAVING_WEIGHTS["caffeine"].items():
-                weights[domain] = weights.get(domain, 0) + (weight * frequency_multiplier)
+        if "caffeine" in matched:
+            for index, weight in craving_terms["caffeine"]:
+                totals[index] += weight
 
             # If >3 cups/day or "to function" after poor sleep → STR +0.10
-            if ">3 cups" in text or "3+ cups" in text or "to function" in text or "to get going" in text:
-                weights["STR"] = weights.get("STR", 0) + 0.10
+            if "caffeine_dependence" in matched:
+                totals[_STR] += 0.10
 
         # E) Salty
-        if "salty" in text or "salt" in text:
+        if "salt" in matched:
             # Neutral by default
             # Exception: If dizziness on standing / low BP / fatigue → HRM +0.30
-            if other_symptoms:
-                other_lower = other_symptoms.lower()
-                has_dizziness = any(kw in other_lower for kw in self.DIZZINESS_KEYWORDS)
-                has_low_bp = any(kw in other_lower for kw in self.LOW_BP_KEYWORDS)
-                has_fatigue = "fatigue" in other_lower or "tired" in other_lower
+            has_dizziness = "dizziness" in symptoms_matched
+            has_low_bp = "low_bp" in symptoms_matched
+            has_fatigue = "fatigue" in symptoms_matched
 
-                if has_dizziness or has_low_bp or (has_fatigue and has_dizziness):
-                    weights["HRM"] = weights.get("HRM", 0) + 0.30
+            if has_dizziness or has_low_bp or (has_fatigue and has_dizziness):
+                totals[_HRM] += 0.30
 
         # F) Other (text parsed)
-        if "other" in text:
-            # Extract text after "other"
-            other_match = re.search(r'other[:\s]+(.+)', text)
-            if other_match:
-                other_text = other_match.group(1)
-                other_weights = self._parse_other_text(other_text)
-
-                # Apply frequency multiplier
-                for domain, weight in other_weights.items():
-                    weights[domain] = weights.get(domain, 0) + (weight * frequency_multiplier)
-
-        # Apply domain caps
-        for domain in weights:
-            if domain in self.DOMAIN_CAPS:
-                weights[domain] = min(weights[domain], self.DOMAIN_CAPS[domain])
+        if other_matched:
+            other_weights = self._parse_other_text(other_matched)
+
+            # Apply frequency multiplier
+            for domain, weight in other_weights.items():
+                totals[_DOMAIN_INDEX[domain]] += weight * frequency_multiplier
+
+        # Apply domain caps; only domains that scored are reported
+        weights = {
+            domain: min(total, cap)
+            for domain, cap, total in zip(_DOMAIN_NAMES, _DOMAIN_CAP_VALUES, totals)
+            if total > 0
+        }
 
         return (weights, flags)
 
+    def get_food_cravings_weights_batch(
+        self,
+        cravings_data: Any,
+        sleep_hours: Any = None,
+        sleep_irregular: Any = False,
+        sex: Any = None,
+        menstrual_pattern: Any = None,
+        other_symptoms: Any = None
+    ) -> Tuple[Dict[str, "np.ndarray"], List[List[str]]]:
+        """
+        Vectorized version of get_food_cravings_weights for many patients at once.
+
+        Each distinct answer is classified once; the per-row keyword hits form
+        membership matrices, and the craving weights, amplifiers and caps run
+        as array operations over all rows.
+
+        Args:
+            cravings_data: Iterable of multi-select answers (one per patient)
+            sleep_hours: Array-like of hours (NaN/None = unknown) or one value for all rows
+            sleep_irregular: Array-like of bools or one value for all rows
+            sex: Iterable of sex values or one value for all rows
+            menstrual_pattern: Iterable of pattern texts or one value for all rows
+            other_symptoms: Iterable of symptom texts or one value for all rows
+
+        Returns:
+            Tuple of (weights, flags)
+            - weights: Dict mapping domain → float array (one weight per patient,
+              0.0 where the scalar method reports no weight)
+            - flags: One flags list per patient, as from the scalar method
+        """
+        import numpy as np
+
+        craving_matrix, other_matrix, domain_cap_vector = _batch_arrays()
+
+        records = list(cravings_data)
+        n = len(records)
+        hours = np.broadcast_to(
+            np.asarray(np.nan if sleep_hours is None else sleep_hours, dtype=float), (n,)
+        )
+        irregular = np.broadcast_to(np.asarray(sleep_irregular, dtype=bool), (n,))
+        sexes = _per_row(sex, n)
+        patterns = _per_row(menstrual_pattern, n)
+        symptoms = _per_row(other_symptoms, n)
+
+        # Classify each distinct answer once
+        classified: Dict[Any, Optional[Tuple[FrozenSet[str], FrozenSet[str]]]] = {}
+        for record in records:
+            key = str(record) if record else ""
+            if key not in classified:
+                classified[key] = self._classify_cravings(record)
+
+        # Membership matrices: rows = patients, columns = cravings / "Other" categories / rule buckets
+        craving_mask: np.ndarray = np.zeros((n, len(_BATCH_CRAVINGS)), dtype=bool)
+        other_mask: np.ndarray = np.zeros((n, len(_OTHER_CATEGORIES)), dtype=bool)
+        rule_mask: np.ndarray = np.zeros((n, len(_BATCH_RULES)), dtype=bool)
+        multiplier: np.ndarray = np.ones(n)
+        for row, record in enumerate(records):
+            hits = classified[str(record) if record else ""]
+            if hits is None:
+                continue
+            matched, other_matched = hits
+            symptoms_matched = _scan_keywords(symptoms[row].lower()) if symptoms[row] else _NO_MATCHES
+            craving_mask[row] = [bucket in matched for bucket, _ in _BATCH_CRAVINGS]
+            other_mask[row] = [category in other_matched for category in _OTHER_CATEGORIES]
+            rule_mask[row] = [
+                "caffeine_dependence" in matched,
+                "post_meal_crash" in symptoms_matched,
+                "dizziness" in symptoms_matched or "low_bp" in symptoms_matched,
+                bool(sexes[row]) and sexes[row].lower() in self.FEMALE_VALUES and bool(patterns[row])
+                and "cyclical" in _scan_keywords(patterns[row].lower()),
+            ]
+            multiplier[row] = self._detect_frequency_multiplier(matched)
+        sweets, bread_pasta, chocolate, caffeine, salty = craving_mask.T
+        heavy_caffeine, post_meal_crash, orthostatic, cyclical = rule_mask.T
+
+        # Base craving weights and "Other" categories, both scaled by frequency
+        weights = ((craving_mask * multiplier[:, None]) @ craving_matrix
+                   + (other_mask @ other_matrix) * multiplier[:, None])
+
+        # Amplifiers
+        weights[:, _STR] += 0.10 * (sweets & ((hours < 6) | irregular))
+        weights[:, _CM] += 0.10 * (bread_pasta & post_meal_crash)
+        weights[:, _HRM] += 0.20 * (chocolate & cyclical)
+        weights[:, _STR] += 0.10 * (caffeine & heavy_caffeine)
+        weights[:, _HRM] += 0.30 * (salty & orthostatic)
+
+        # Per-domain caps
+        np.minimum(weights, domain_cap_vector, out=weights)
+
+        return {domain: weights[:, col] for col, domain in enumerate(_DOMAIN_NAMES)}, [[] for _ in range(n)]
+
+
+def _per_row(values: Any, n: int) -> List[Any]:
+    """Spread one value (or None) over n rows; iterables are taken row by row."""
+    if values is None or isinstance(values, str):
+        return [values] * n
+    return list(values)
+
+
+# Domains in a fixed order so scoring accumulates into a flat list by index
+_DOMAIN_NAMES: Tuple[str, ...] = tuple(FoodCravingsRuleset.DOMAIN_CAPS)
+_DOMAIN_CAP_VALUES: Tuple[float, ...] = tuple(FoodCravingsRuleset.DOMAIN_CAPS.values())
+_DOMAIN_INDEX: Dict[str, int] = {domain: index for index, domain in enumerate(_DOMAIN_NAMES)}
+_CM = _DOMAIN_INDEX["CM"]
+_STR = _DOMAIN_INDEX["STR"]
+_HRM = _DOMAIN_INDEX["HRM"]
+
+# Base craving weights as (domain index, weight × multiplier) pairs, prescaled
+# for each value _detect_frequency_multiplier can return
+_SCALED_CRAVING_TERMS: Dict[float, Dict[str, Tuple[Tuple[int, float], ...]]] = {
+    multiplier: {
+        craving: tuple((_DOMAIN_INDEX[domain], weight * multiplier) for domain, weight in scores.items())
+        for craving, scores in FoodCravingsRuleset.CRAVING_WEIGHTS.items()
+    }
+    for multiplier in (1.0, 1.25, 1.5)
+}
+
+
+# Array layout for batch scoring: columns follow _DOMAIN_NAMES; craving rows are
+# (bucket, CRAVING_WEIGHTS key) and "Other" rows follow _OTHER_CATEGORIES
+_BATCH_CRAVINGS = (
+    ("sweet", "sweets"),
+    ("bread_pasta", "bread_pasta"),
+    ("chocolate", "chocolate"),
+    ("caffeine", "caffeine"),
+    ("salt", "salty"),
+)
+_BATCH_RULES = ("heavy_caffeine", "post_meal_crash", "orthostatic", "cyclical")
+
+
+# Keyword buckets, each a set of substrings tested against normalized text.
+# A keyword may sit in several buckets ("bread" is both a craving item and the
+# bread/pasta craving).
+_KEYWORD_BUCKETS: Dict[str, Tuple[str, ...]] = {
+    "none": ("none", "no", "na"),
+    "craving_item": ("sweets", "salty", "bread", "pasta", "chocolate", "caffeine", "other"),
+    "sweet": ("sweet",),
+    "bread_pasta": ("bread", "pasta"),
+    "chocolate": ("chocolate",),
+    "caffeine": ("caffeine",),
+    "caffeine_dependence": tuple(FoodCravingsRuleset.HEAVY_CAFFEINE_TERMS),
+    "salt": ("salt",),
+    "other": ("other",),
+    "high_frequency": tuple(FoodCravingsRuleset.HIGH_FREQUENCY_TERMS),
+    "moderate_frequency": tuple(FoodCravingsRuleset.MODERATE_FREQUENCY_TERMS),
+    "alcohol": tuple(FoodCravingsRuleset.ALCOHOL_KEYWORDS),
+    "energy_drink": tuple(FoodCravingsRuleset.ENERGY_DRINK_KEYWORDS),
+    "fast_food": tuple(FoodCravingsRuleset.FAST_FOOD_KEYWORDS),
+    "ultra_processed": tuple(FoodCravingsRuleset.UPF_KEYWORDS),
+    "late_night": tuple(FoodCravingsRuleset.LATE_NIGHT_KEYWORDS),
+    "dizziness": tuple(FoodCravingsRuleset.DIZZINESS_KEYWORDS),
+    "low_bp": tuple(FoodCravingsRuleset.LOW_BP_KEYWORDS),
+    "post_meal_crash": tuple(FoodCravingsRuleset.POST_MEAL_CRASH_KEYWORDS),
+    "fatigue": ("fatigue", "tired"),
+    "cyclical": tuple(FoodCravingsRuleset.PMS_TERMS),
+}
+
+# "Other" lexicon categories in scoring order (bucket names match OTHER_LEXICON keys)
+_OTHER_CATEGORIES = ("alcohol", "energy_drink", "fast_food", "ultra_processed", "late_night")
+
+
+@lru_cache(maxsize=None)
+def _batch_arrays() -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Weight matrices for get_food_cravings_weights_batch, built once on first call.
+
+    Returns (craving matrix, "Other" matrix, domain caps); columns follow _DOMAIN_NAMES.
+    """
+    import numpy as np
+
+    craving_matrix = np.array([
+        [FoodCravingsRuleset.CRAVING_WEIGHTS[craving].get(domain, 0.0) for domain in _DOMAIN_NAMES]
+        for _, craving in _BATCH_CRAVINGS
+    ])
+    other_matrix = np.array([
+        [FoodCravingsRuleset.OTHER_LEXICON[category].get(domain, 0.0) for domain in _DOMAIN_NAMES]
+        for category in _OTHER_CATEGORIES
+    ])
+    return craving_matrix, other_matrix, np.array(_DOMAIN_CAP_VALUES)
+
+
+_NO_MATCHES: FrozenSet[str] = frozenset()
+
+
+def _group_keywords() -> Dict[str, Tuple[str, ...]]:
+    """Invert _KEYWORD_BUCKETS into keyword → buckets."""
+    grouped: Dict[str, List[str]] = {}
+    for bucket, keywords in _KEYWORD_BUCKETS.items():
+        for keyword in keywords:
+            grouped.setdefault(keyword, []).append(bucket)
+    return {keyword: tuple(buckets) for keyword, buckets in grouped.items()}
+
+
+_KEYWORD_INDEX = _group_keywords()
+
+# One-pass matcher over every keyword; payload = (keyword length, buckets it belongs to)
+_KEYWORD_AUTOMATON = build_keyword_automaton(
+    (keyword, (len(keyword), buckets)) for keyword, buckets in _KEYWORD_INDEX.items()
+)
+
+
+def _contained_buckets() -> Dict[str, Tuple[str, ...]]:
+    """Map each keyword to its own buckets plus those of every keyword it contains."""
+    return {
+        keyword: tuple(sorted({
+            bucket
+            for other, buckets in _KEYWORD_INDEX.items() if other in keyword
+            for bucket in buckets
+        }))
+        for keyword in _KEYWORD_INDEX
+    }
+
+
+# Fallback without pyahocorasick: one master regex. The zero-width lookahead
+# tries every position and longest keywords come first, so a hit also implies
+# every keyword it contains (e.g. "sweets" → "sweet"), as _KEYWORD_CONTAINED maps.
+_KEYWORD_CONTAINED = _contained_buckets()
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_INDEX, key=len, reverse=True)) + "))"
+)
+
+
+def _other_text_span(text: str) -> Tuple[int, int]:
+    """
+    Return offsets [start, end) of the free text after the first "other" that is
+    followed by ':' or whitespace, up to the end of that line ((0, 0) if none).
+
+    Same span as re.search(r'other[:\s]+(.+)', text).group(1), except where the
+    regex would capture bare separators, which carry no keywords.
+    """
+    start = text.find("other")
+    while start != -1:
+        tail = text[start + 5:]
+        rest = tail.lstrip()
+        while rest[:1] == ":":
+            rest = rest[1:].lstrip()
+        if rest and len(rest) < len(tail):
+            rest_start = len(text) - len(rest)
+            end = text.find("\n", rest_start)
+            return rest_start, (len(text) if end == -1 else end)
+        start = text.find("other", start + 1)
+    return 0, 0
+
+
+def _keyword_hits(text: str) -> List[Tuple[int, Tuple[str, ...]]]:
+    """Return (start offset, buckets) for every keyword occurrence in lowercased text, in one pass."""
+    if _KEYWORD_AUTOMATON is not None:
+        return [(end - length + 1, buckets) for end, (length, buckets) in _KEYWORD_AUTOMATON.iter(text)]
+    return [(match.start(), _KEYWORD_CONTAINED[match.group(1)]) for match in _KEYWORD_RE.finditer(text)]
+
+
+@lru_cache(maxsize=4096)
+def _classify_text(text: str) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+    """
+    Classify a normalized cravings answer (see FoodCravingsRuleset._classify_cravings).
+
+    "Other"-text buckets come from the same pass: they are the hits that start
+    inside the span after "other" (no keyword contains a separator run or a
+    line break, so a hit cannot straddle the span).
+    """
+    hits = _keyword_hits(text)
+    matched = frozenset(bucket for _, buckets in hits for bucket in buckets)
+
+    # Check if "None" is selected with other items → drop None
+    has_none = "none" in matched
+    has_other_items = "craving_item" in matched
+
+    if has_none and has_other_items:
+        # Drop "None" - user selected both None and actual cravings
+        text = text.replace("none", "").replace("no", "").replace("na", "")
+        hits = _keyword_hits(text)
+        matched = frozenset(bucket for _, buckets in hits for bucket in buckets)
+    elif has_none and not has_other_items:
+        # Only "None" selected → no scoring
+        return None
+
+    if "other" not in matched:
+        return matched, _NO_MATCHES
+
+    # Buckets within the text after "other"
+    start, end = _other_text_span(text)
+    return matched, frozenset(
+        bucket for position, buckets in hits if start <= position < end for bucket in buckets
+    )
+
+
+@lru_cache(maxsize=4096)
+def _scan_keywords(text: str) -> FrozenSet[str]:
+    """
+    Return the keyword buckets whose keywords occur as substrings of lowercased text.
+
+    Memoized: answers come from a fixed chip list and a handful of symptom
+    phrasings, so repeat submissions skip the scan entirely.
+    """
+    if not text:
+        return _NO_MATCHES
+    return frozenset(bucket for _, buckets in _keyword_hits(text) for bucket in buckets)
@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 import re
 from src.aether_2.utils.text_processing import split_by_delimiters
 from .constants import (
@@ -6,11 +7,87 @@ from .constants import (
     get_spacy_model,
     preprocess_lexicons,
     lemmatize_text,
-    match_keyword_fuzzy,
-    RAPIDFUZZ_AVAILABLE
+    lemmatize_texts,
+    RAPIDFUZZ_AVAILABLE,
+    build_keyword_automaton
 )
 
 
+# Common typos and synonyms, applied in a single alternation pass
+_SYNONYMS = {
+    "diarrhoea": "diarrhea",
+    "stomach acid": "heartburn",
+    "stomachache": "abdominal pain",
+    "tummy": "abdominal",
+    "poop": "stool",
+    "bm": "bowel movement"
+}
+_SYNONYM_RE = re.compile("|".join(map(re.escape, _SYNONYMS)))
+
+# Runs of punctuation and whitespace (anything but word chars and ; , -)
+_NON_TEXT_RE = re.compile(r'[^\w;,\-]+')
+
+# Goal separators: semicolons, line breaks, commas and a whitespace-delimited
+# 'and' (its whitespace excludes line breaks, which already separate goals)
+_GOAL_SPLIT_RE = re.compile(r'[;\n,]|[^\S\n]+and[^\S\n]+', re.IGNORECASE)
+
+# Negation cue followed by whitespace (\b also matches at the start of the text)
+_NEGATION_RE = re.compile(r'\b(?:no|not|without)\s')
+
+# Substring alternations for the cross-map and bonus checks
+_HEADACHE_RE = re.compile(r'migraine|headache')
+_FOCUS_RE = re.compile(r'focus|clarity|concentrate')
+_SKIN_RE = re.compile(r'acne|eczema|psoriasis|rashes|dermatitis|clear skin')
+_DETOX_RE = re.compile(r'detox|cleanse|reduce toxins|chemical')
+
+
+def _replace_synonym(match: "re.Match[str]") -> str:
+    return _SYNONYMS[match.group(0)]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_goals_text(text: str) -> str:
+    """Memoized body of HealthGoalsRuleset._normalize_text (pure in its input)."""
+    # Lowercase, then normalize common typos and synonyms in one pass
+    text = _SYNONYM_RE.sub(_replace_synonym, text.lower())
+
+    # Remove punctuation (keep basic separators) and collapse whitespace
+    return _NON_TEXT_RE.sub(' ', text).strip()
+
+
+# Codes for the cross-mapping lexicons; lowercase so they never collide with domain codes
+_PAIN = "pain"
+_LONGEVITY = "longevity"
+_SLEEP = "sleep"
+
+
+def _build_intent_matcher(lexicons: Dict[str, Iterable[str]]) -> Tuple[Any, Dict[str, Tuple[str, ...]]]:
+    """
+    Index lexicon keywords for one-pass matching.
+
+    Returns:
+        (automaton, index): index maps keyword → codes of every lexicon that
+        lists it ("burnout" is both MITO and STR); automaton is None when
+        pyahocorasick is not available
+    """
+    grouped: Dict[str, List[str]] = {}
+    for code, keywords in lexicons.items():
+        for keyword in keywords:
+            grouped.setdefault(keyword, [])
+            if code not in grouped[keyword]:
+                grouped[keyword].append(code)
+    index = {keyword: tuple(codes) for keyword, codes in grouped.items()}
+    return build_keyword_automaton(index.items()), index
+
+
+def _scan_intents(matcher: Tuple[Any, Dict[str, Tuple[str, ...]]], text: str) -> Set[str]:
+    """Return the codes of every lexicon with a keyword occurring in text (substring match)."""
+    automaton, index = matcher
+    if automaton is not None:
+        return {code for _, codes in automaton.iter(text) for code in codes}
+    return {code for keyword, codes in index.items() if keyword in text for code in codes}
+
+
 class HealthGoalsRuleset:
 
     def __init__(self):
@@ -18,8 +95,10 @@ class HealthGoalsRuleset:
         # Load shared spaCy model
         self.nlp = get_spacy_model()
 
-        # Pre-lemmatize all keywords for faster matching
-        self.lemmatized_lexicons = preprocess_lexicons(self.LEXICONS, self.nlp) if self.nlp else {}
+        # Pre-lemmatized keywords and their automaton, built once per spaCy model
+        self.lemmatized_lexicons, self._lemma_matcher = (
+            _lemma_lexicons(self.nlp) if self.nlp else ({}, None)
+        )
 
     CAPS = {
         "CM": 0.60,
@@ -95,6 +174,9 @@ class HealthGoalsRuleset:
         "long aging", "aging well", "live longer"
     ]
 
+    # Sleep-related goals (cross-map to COG)
+    SLEEP_KEYWORDS = ["improve sleep", "sleep better", "sleep quality", "better sleep"]
+
 
 
     def get_health_goals_weights(
@@ -116,7 +198,7 @@ class HealthGoalsRuleset:
             - goal_details: List of dicts with per-goal breakdown for reason tracking
               [{"rank": 1, "goal_text": "lose weight", "matched_domains": ["CM"], "weight": 0.35, "scores": {"CM": 0.35}}]
         """
-        scores = {code: 0.0 for code in FOCUS_AREAS}
+        scores = dict.fromkeys(FOCUS_AREAS, 0.0)
         safety_flags = {"crisis": False, "urgent_care": False}
         goal_details = []  # Track individual goal contributions
 
@@ -135,8 +217,13 @@ class HealthGoalsRuleset:
             # Return scores but with crisis flag set
             return scores, safety_flags, goal_details
 
-        # Split goals using shared utility function
-        goals = split_by_delimiters(normalized_text)[:3]  # Keep first 3 unique
+        # Split goals using shared utility function. Normalized text keeps only
+        # word characters, spaces and , ; - so without those separators (the
+        # common single-goal answer) it is already the one goal
+        if "," in normalized_text or ";" in normalized_text or "-" in normalized_text:
+            goals = split_by_delimiters(normalized_text)[:3]  # Keep first 3 unique
+        else:
+            goals = [normalized_text] if normalized_text else []
 
         if not goals:
             return scores, safety_flags, goal_details
@@ -144,25 +231,31 @@ class HealthGoalsRuleset:
         # Priority weights by rank
         weights_by_rank = [0.35, 0.30, 0.25]
 
+        # Lowercase once; every helper below takes the lowercased goal
+        goals_lower = [goal.lower() for goal in goals]
+
+        # Lemmatize all goals in one spaCy batch (unused without spaCy)
+        goal_lemmas = lemmatize_texts(goals_lower, self.nlp) if self.nlp else goals_lower
+
         # Process each goal
-        for i, goal in enumerate(goals):
+        for i, (goal, goal_lower, goal_lemmatized) in enumerate(zip(goals, goals_lower, goal_lemmas)):
             if i >= len(weights_by_rank):
                 break
 
             # Check for negation
-            if self._is_negated(goal):
+            if self._is_negated(goal_lower):
                 continue
 
             weight = weights_by_rank[i]
 
             # Match intents (returns list of (domain, fraction) tuples)
-            intents = self._match_intents(goal)
+            intents = self._match_intents(goal_lower, goal_lemmatized)
 
             if not intents:
                 continue
 
             # Track per-goal scores for reason tracking
-            goal_scores = {code: 0.0 for code in FOCUS_AREAS}
+            goal_scores = dict.fromkeys(FOCUS_AREAS, 0.0)
 
             # Apply base weight to each mapped domain
             for domain, fraction in intents:
@@ -171,14 +264,15 @@ class HealthGoalsRuleset:
                 goal_scores[domain] += contribution
 
             # Intensity modifier
-            if self._has_intensifier(goal):
+            if self._has_intensifier(goal_lower):
                 for domain, _ in intents:
                     scores[domain] += 0.05
                     goal_scores[domain] += 0.05
 
             # Apply bonus logic
-            scores = self._apply_bonus_logic(goal, scores, intents)
-            goal_scores = self._apply_bonus_logic(goal, goal_scores, intents)
+            for domain in self._bonus_domains(goal_lower):
+                scores[domain] += 0.05
+                goal_scores[domain] += 0.05
 
             # Record goal details for reason tracking
             matched_domains = [domain for domain, _ in intents]
@@ -191,8 +285,7 @@ class HealthGoalsRuleset:
             })
 
         # Apply caps
-        for domain in scores:
-            scores[domain] = min(scores[domain], self.CAPS.get(domain, 1.0))
+        scores = {domain: min(scores[domain], cap) for domain, cap in _FOCUS_AREA_CAPS}
 
         return scores, safety_flags, goal_details
     
@@ -201,247 +294,140 @@ class HealthGoalsRuleset:
         if not text:
             return ""
         
-        # Lowercase
-        text = text.lower()
-        
-        # Normalize common typos and synonyms
-        replacements = {
-            "diarrhoea": "diarrhea",
-            "stomach acid": "heartburn",
-            "stomachache": "abdominal pain",
-            "tummy": "abdominal",
-            "poop": "stool",
-            "bm": "bowel movement"
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        # Remove punctuation (keep spaces and basic separators)
-        text = re.sub(r'[^\w\s;,\-]', ' ', text)
-        
-        # Normalize whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        return _normalize_goals_text(text)
     
     def _split_goals(self, text: str) -> List[str]:
         """Split goals by semicolons, line breaks, 'and', commas."""
         if not text:
             return []
         
-        # Split by semicolons first
-        parts = re.split(r'[;\n]', text)
-        
-        # Then split by ' and ' and commas
-        all_parts = []
-        for part in parts:
-            # Split by ' and ' (with word boundaries)
-            sub_parts = re.split(r'\s+and\s+', part, flags=re.IGNORECASE)
-            for sub_part in sub_parts:
-                # Split by commas
-                comma_parts = [p.strip() for p in sub_part.split(',')]
-                all_parts.extend(comma_parts)
-        
-        # Clean and filter empty
-        goals = [g.strip() for g in all_parts if g.strip()]
-        return goals
+        # One split on every separator, then clean and filter empty
+        return [goal for goal in (part.strip() for part in _GOAL_SPLIT_RE.split(text)) if goal]
     
     def _dedupe_goals(self, goals: List[str]) -> List[str]:
         """Remove duplicates while preserving order."""
-        seen = set()
-        unique = []
+        # Ordered dict keyed case-insensitively; setdefault keeps the first spelling
+        first_by_key: Dict[str, str] = {}
         for goal in goals:
-            goal_lower = goal.lower().strip()
-            if goal_lower and goal_lower not in seen:
-                seen.add(goal_lower)
-                unique.append(goal)
-        return unique
+            first_by_key.setdefault(goal.lower().strip(), goal)
+        first_by_key.pop("", None)
+        return list(first_by_key.values())
     
-    def _is_negated(self, text: str) -> bool:
-        """Check if text is negated (preceded by 'no', 'not', 'without')."""
-        text_lower = text.lower().strip()
-        negation_patterns = [
-            r'^no\s+',
-            r'^not\s+',
-            r'^without\s+',
-            r'\bno\s+',
-            r'\bnot\s+',
-            r'\bwithout\s+'
-        ]
-        for pattern in negation_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+    def _is_negated(self, text_lower: str) -> bool:
+        """Check if lowercased text is negated (preceded by 'no', 'not', 'without')."""
+        return _NEGATION_RE.search(text_lower.strip()) is not None
     
-    def _check_safety_flags(self, text: str) -> Dict[str, bool]:
-        """Check for crisis and urgent care keywords."""
+    def _check_safety_flags(self, text_lower: str) -> Dict[str, bool]:
+        """Check lowercased (normalized) text for crisis and urgent care keywords."""
         flags = {"crisis": False, "urgent_care": False}
-        text_lower = text.lower()
         
-        # Check crisis keywords
-        for keyword in self.CRISIS_KEYWORDS:
-            if keyword in text_lower:
+        # One regex pass; each hit names the flag it sets
+        for match in _SAFETY_RE.finditer(text_lower):
+            if match.lastgroup == "crisis":
                 flags["crisis"] = True
-                break
-        
-        # Check urgent care keywords
-        for keyword in self.URGENT_CARE_KEYWORDS:
-            if keyword in text_lower:
+            else:
                 flags["urgent_care"] = True
+            if flags["crisis"] and flags["urgent_care"]:
                 break
         
         return flags
     
-    def _has_intensifier(self, text: str) -> bool:
-        """Check if text contains intensity modifiers."""
-        text_lower = text.lower()
-        for intensifier in self.INTENSIFIERS:
-            if intensifier in text_lower:
-                return True
-        return False
+    def _has_intensifier(self, text_lower: str) -> bool:
+        """Check if lowercased text contains intensity modifiers."""
+        return _INTENSIFIER_RE.search(text_lower) is not None
     
-    def _match_intents(self, goal: str) -> List[Tuple[str, float]]:
+    def _match_intents(self, goal_lower: str, goal_lemmatized: Optional[str] = None) -> List[Tuple[str, float]]:
         """
-        Hybrid matching pipeline:
+        Hybrid matching pipeline over a lowercased goal:
         1. Try lemmatized match (fast path) - handles word forms
         2. If no match, try fuzzy match (slow path) - handles typos
         3. Apply cross-mapping logic (pain, longevity, sleep)
 
+        goal_lemmatized may be passed in when goals were lemmatized as a batch.
+
         Returns list of (domain, fraction) tuples.
         """
         intents = []
-        goal_lower = goal.lower()
+
+        # Lexicon (and cross-mapping) hits from one automaton pass; with spaCy the
+        # cross-mapping terms are matched on lemmas, otherwise on the raw text
+        cross_hits: Set[str] = set()
 
         # STAGE 1: Lemmatized matching (fast path)
-        if self.nlp and self.lemmatized_lexicons:
-            goal_lemmatized = lemmatize_text(goal_lower, self.nlp)
+        if self.nlp:
+            if goal_lemmatized is None:
+                goal_lemmatized = lemmatize_text(goal_lower, self.nlp)
+            cross_hits = _scan_intents(self._lemma_matcher, goal_lemmatized)
 
-            for domain, lemma_keywords in self.lemmatized_lexicons.items():
-                for lemma_keyword in lemma_keywords:
-                    if lemma_keyword in goal_lemmatized:
-                        intents.append((domain, 1.0))
-                        break  # Only match once per domain per goal
+            # Only match once per domain per goal
+            intents = [(domain, 1.0) for domain in self.lemmatized_lexicons if domain in cross_hits]
 
         # STAGE 2: Fuzzy matching fallback (slow path) - only if no exact match
         if not intents and RAPIDFUZZ_AVAILABLE:
-            for domain, keywords in self.LEXICONS.items():
-                for keyword in keywords:
-                    if match_keyword_fuzzy(keyword, goal_lower, threshold=85):
-                        intents.append((domain, 0.95))  # Slightly lower confidence for fuzzy
-                        break  # Only match once per domain per goal
+            intents = list(_fuzzy_intents(goal_lower))
 
         # STAGE 3: Fallback to simple substring (if no NLP libraries available)
-        if not intents:
-            for domain, keywords in self.LEXICONS.items():
-                for keyword in keywords:
-                    if keyword in goal_lower:
-                        intents.append((domain, 1.0))
-                        break  # Only match once per domain per goal
+        if not intents or not self.nlp:
+            raw_hits = _scan_intents(_RAW_MATCHER, goal_lower)
+            if not intents:
+                # Only match once per domain per goal
+                intents = [(domain, 1.0) for domain in self.LEXICONS if domain in raw_hits]
+            if not self.nlp:
+                cross_hits = raw_hits
 
         # CROSS-MAPPING LOGIC (same as before)
+        cross_domains: List[str] = []
 
         # Check pain/musculoskeletal (cross-maps)
-        pain_matched = False
-        for keyword in self.PAIN_KEYWORDS:
-            # Use lemmatized matching if available
-            if self.nlp:
-                keyword_lemma = lemmatize_text(keyword, self.nlp)
-                goal_lemmatized = lemmatize_text(goal_lower, self.nlp)
-                if keyword_lemma in goal_lemmatized:
-                    pain_matched = True
-                    break
-            elif keyword in goal_lower:
-                pain_matched = True
-                break
-
-        if pain_matched:
+        if _PAIN in cross_hits:
             # Cross-map: STR, IMM, MITO
-            if ("STR", 1.0) not in intents:
-                intents.append(("STR", 1.0))
-            if ("IMM", 1.0) not in intents:
-                intents.append(("IMM", 1.0))
-            if ("MITO", 1.0) not in intents:
-                intents.append(("MITO", 1.0))
+            cross_domains += ("STR", "IMM", "MITO")
 
             # If migraines/headaches + focus/clarity phrase
-            if any(term in goal_lower for term in ["migraine", "headache", "headaches"]):
-                if any(term in goal_lower for term in ["focus", "clarity", "concentrate"]):
-                    if ("COG", 1.0) not in intents:
-                        intents.append(("COG", 1.0))
+            if _HEADACHE_RE.search(goal_lower) and _FOCUS_RE.search(goal_lower):
+                cross_domains.append("COG")
 
         # Check longevity/prevention
-        longevity_matched = False
-        for keyword in self.LONGEVITY_KEYWORDS:
-            # Use lemmatized matching if available
-            if self.nlp:
-                keyword_lemma = lemmatize_text(keyword, self.nlp)
-                goal_lemmatized = lemmatize_text(goal_lower, self.nlp)
-                if keyword_lemma in goal_lemmatized:
-                    longevity_matched = True
-                    break
-            elif keyword in goal_lower:
-                longevity_matched = True
-                break
-
-        if longevity_matched:
+        if _LONGEVITY in cross_hits:
             # Distributed: CM, MITO, IMM
-            if ("CM", 1.0) not in intents:
-                intents.append(("CM", 1.0))
-            if ("MITO", 1.0) not in intents:
-                intents.append(("MITO", 1.0))
-            if ("IMM", 1.0) not in intents:
-                intents.append(("IMM", 1.0))
+            cross_domains += ("CM", "MITO", "IMM")
 
         # Special handling for sleep-related goals (STR + COG)
-        sleep_terms = ["improve sleep", "sleep better", "sleep quality", "better sleep"]
-        sleep_matched = False
-        for term in sleep_terms:
-            if self.nlp:
-                term_lemma = lemmatize_text(term, self.nlp)
-                goal_lemmatized = lemmatize_text(goal_lower, self.nlp)
-                if term_lemma in goal_lemmatized:
-                    sleep_matched = True
-                    break
-            elif term in goal_lower:
-                sleep_matched = True
-                break
-
-        if sleep_matched:
-            if ("COG", 1.0) not in intents:
-                intents.append(("COG", 1.0))
+        if _SLEEP in cross_hits:
+            cross_domains.append("COG")
 
-        # Dedupe intents (keep first occurrence)
-        seen = set()
-        unique_intents = []
-        for domain, fraction in intents:
+        # Keep the first intent per domain (stages above yield each domain once)
+        seen = {domain for domain, _ in intents}
+        for domain in cross_domains:
             if domain not in seen:
                 seen.add(domain)
-                unique_intents.append((domain, fraction))
+                intents.append((domain, 1.0))
 
-        return unique_intents if unique_intents else []
+        return intents
     
-    def _apply_bonus_logic(self, goal: str, scores: Dict[str, float], intents: List[Tuple[str, float]]) -> Dict[str, float]:
-        """Apply bonus logic for specific terms."""
-        goal_lower = goal.lower()
+    def _bonus_domains(self, goal_lower: str) -> List[str]:
+        """
+        Bonus terms in a lowercased goal, as the domains to raise by 0.05 each
+        (in order, so a domain listed twice gets +0.10).
+        """
+        bonus_domains: List[str] = []
         
         # FODMAP → IMM +0.05
         if "fodmap" in goal_lower:
-            scores["IMM"] += 0.05
+            bonus_domains.append("IMM")
         
         # Histamine → IMM +0.05
         if "histamine" in goal_lower:
-            scores["IMM"] += 0.05
+            bonus_domains.append("IMM")
         
         # Skin issues → IMM +0.05 and GA +0.05
-        skin_keywords = ["acne", "eczema", "psoriasis", "rashes", "dermatitis", "clear skin"]
-        if any(keyword in goal_lower for keyword in skin_keywords):
-            scores["IMM"] += 0.05
-            scores["GA"] += 0.05
+        if _SKIN_RE.search(goal_lower):
+            bonus_domains.append("IMM")
+            bonus_domains.append("GA")
         
         # Detox/chemicals → IMM +0.05
-        if any(term in goal_lower for term in ["detox", "cleanse", "reduce toxins", "chemical"]):
-            scores["IMM"] += 0.05
+        if _DETOX_RE.search(goal_lower):
+            bonus_domains.append("IMM")
         
         # Pain/musculoskeletal cross-map bonuses
         # Base weights are applied in match_intents, but we need to ensure proper distribution
@@ -452,5 +438,87 @@ class HealthGoalsRuleset:
         # Base weights are applied in match_intents to CM, MITO, IMM
         # The distributed nature is handled by the base weight application
         
-        return scores
+        return bonus_domains
+
+
+# Cross-mapping lexicons, matched in the same pass as the focus-area lexicons
+_CROSS_MAP_LEXICONS: Dict[str, List[str]] = {
+    _PAIN: HealthGoalsRuleset.PAIN_KEYWORDS,
+    _LONGEVITY: HealthGoalsRuleset.LONGEVITY_KEYWORDS,
+    _SLEEP: HealthGoalsRuleset.SLEEP_KEYWORDS,
+}
+
+# Crisis / urgent-care keywords as named groups of one pattern. The lookahead
+# tests every start position, so no hit can hide inside another (crisis and
+# urgent keywords never start at the same position).
+_SAFETY_RE = re.compile(
+    "(?=(?P<crisis>" + "|".join(map(re.escape, HealthGoalsRuleset.CRISIS_KEYWORDS)) + ")"
+    "|(?P<urgent_care>" + "|".join(map(re.escape, HealthGoalsRuleset.URGENT_CARE_KEYWORDS)) + "))"
+)
+
+_INTENSIFIER_RE = re.compile("|".join(map(re.escape, HealthGoalsRuleset.INTENSIFIERS)))
+
+# (domain, cap) for every focus area; domains without an entry in CAPS cap at 1.0
+_FOCUS_AREA_CAPS: Tuple[Tuple[str, float], ...] = tuple(
+    (code, HealthGoalsRuleset.CAPS.get(code, 1.0)) for code in FOCUS_AREAS
+)
 
+# Raw-text matcher for the substring fallback (and cross-maps without spaCy)
+_RAW_MATCHER = _build_intent_matcher({**HealthGoalsRuleset.LEXICONS, **_CROSS_MAP_LEXICONS})
+
+
+def _build_fuzzy_groups(lexicons: Dict[str, List[str]]) -> Tuple[Tuple[int, List[str], List[str]], ...]:
+    """Group lexicon keywords by word count as (word_count, keywords, domain of each keyword)."""
+    groups: Dict[int, Tuple[List[str], List[str]]] = {}
+    for domain, keywords in lexicons.items():
+        for keyword in keywords:
+            group_keywords, group_domains = groups.setdefault(len(keyword.split()), ([], []))
+            group_keywords.append(keyword)
+            group_domains.append(domain)
+    return tuple((word_count, keywords, domains) for word_count, (keywords, domains) in groups.items())
+
+
+# Keyword groups for the fuzzy stage, one cdist call per group
+_FUZZY_GROUPS = _build_fuzzy_groups(HealthGoalsRuleset.LEXICONS)
+
+
+@lru_cache(maxsize=None)
+def _lemma_lexicons(nlp: Any) -> Tuple[Dict[str, Set[str]], Tuple[Any, Dict[str, Tuple[str, ...]]]]:
+    """
+    Lemmatized focus-area lexicons plus one automaton over every lemmatized
+    keyword, cross-mapping terms included.
+
+    The keywords are static, so they are lemmatized once per spaCy model
+    rather than for every ruleset instance (one is created per request).
+    """
+    lemmatized_lexicons = preprocess_lexicons(HealthGoalsRuleset.LEXICONS, nlp)
+    matcher = _build_intent_matcher({
+        **lemmatized_lexicons,
+        **preprocess_lexicons(_CROSS_MAP_LEXICONS, nlp)
+    })
+    return lemmatized_lexicons, matcher
+
+
+@lru_cache(maxsize=4096)
+def _fuzzy_intents(goal_lower: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Fuzzy lexicon matching for a lowercased goal (stage 2 of _match_intents).
+
+    Depends only on the goal and the class lexicons, so recurring goals skip
+    the rapidfuzz scan. Same test as match_keyword_fuzzy (best fuzz.ratio of
+    a keyword against the goal's equally long n-grams), but each keyword
+    length is scored in a single cdist call.
+    """
+    from rapidfuzz import fuzz, process
+
+    words = goal_lower.split()
+    hit_domains: Set[str] = set()
+    for word_count, keywords, domains in _FUZZY_GROUPS:
+        phrases = [" ".join(words[i:i + word_count]) for i in range(len(words) - word_count + 1)]
+        if not phrases:
+            continue
+        best = process.cdist(keywords, phrases, scorer=fuzz.ratio, score_cutoff=85).max(axis=1)
+        hit_domains.update(domain for domain, score in zip(domains, best) if score >= 85)
+
+    # Only match once per domain per goal; slightly lower confidence for fuzzy
+    return tuple((domain, 0.95) for domain in HealthGoalsRuleset.LEXICONS if domain in hit_domains)
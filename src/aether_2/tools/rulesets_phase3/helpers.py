@@ -5,6 +5,9 @@ Helper utilities for Phase 3 rulesets.
 from typing import Tuple, Any
 
 
+_YES_ANSWERS = frozenset({"yes", "y", "true", "1"})
+
+
 def parse_yes_no_with_followup(data: Any) -> Tuple[bool, str]:
     """
     Parse yes/no question with optional followup text.
@@ -42,7 +45,7 @@ def parse_yes_no_with_followup(data: Any) -> Tuple[bool, str]:
     if isinstance(data, dict):
         # Legacy dict format
         answer = str(data.get("answer", "")).strip().lower()
-        is_yes = answer in ["yes", "y", "true", "1"]
+        is_yes = answer in _YES_ANSWERS
         
         if is_yes:
             followup_text = str(data.get("followup", "")).strip()
@@ -51,27 +54,13 @@ def parse_yes_no_with_followup(data: Any) -> Tuple[bool, str]:
         # String format
         data_str = data.strip()
         
-        # Try to split by common separators
-        if ";" in data_str:
-            parts = data_str.split(";", 1)
-            answer = parts[0].strip().lower()
-            is_yes = answer in ["yes", "y", "true", "1"]
-            
-            if is_yes and len(parts) > 1:
-                followup_text = parts[1].strip()
-        
-        elif "," in data_str:
-            parts = data_str.split(",", 1)
-            answer = parts[0].strip().lower()
-            is_yes = answer in ["yes", "y", "true", "1"]
-            
-            if is_yes and len(parts) > 1:
-                followup_text = parts[1].strip()
-        
-        else:
-            # No separator - just yes/no
-            answer = data_str.lower()
-            is_yes = answer in ["yes", "y", "true", "1"]
+        # Answer and followup are split at the first ";" (or "," if there is none)
+        separator = ";" if ";" in data_str else ","
+        answer, _, followup = data_str.partition(separator)
+        is_yes = answer.strip().lower() in _YES_ANSWERS
+
+        if is_yes:
+            followup_text = followup.strip()
     
     return is_yes, followup_text
 
@@ -5,7 +5,9 @@ Analyzes temporal patterns and triggers for when patient last felt well.
 Captures chronicity overlay and specific trigger events (GI infection, post-viral, mold, stress, hormonal).
 """
 
-from typing import Dict, Tuple, List, Any, Optional
+from functools import lru_cache
+from numbers import Real
+from typing import Dict, Tuple, List, Any, Optional, Set
 from datetime import datetime, timedelta
 import re
 from ..rulesets.constants import FOCUS_AREAS
@@ -13,11 +15,30 @@ from .constants import (
     get_spacy_model,
     preprocess_lexicons,
     lemmatize_text,
+    lemmatize_texts,
     match_keyword_fuzzy,
     RAPIDFUZZ_AVAILABLE
 )
 
 
+# "Never felt well" / "can't remember" answers
+_NEVER_WELL_RE = re.compile(
+    r'\bnever\b.*\bwell\b'
+    r'|\bnever\b.*\bfelt\b.*\bgood\b'
+    r'|\bcan\'?t\s+remember\b'
+    r'|\bdon\'?t\s+remember\b'
+)
+
+# Relative time: "2 years ago", "6 months ago", "3yrs ago"
+_TIME_AGO_RE = re.compile(r'(\d+)\s*(year|month|yr|mo)s?\s*ago')
+
+# Four-digit year 19xx / 20xx
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+
+# Relative phrases without a year: "before job change", "since COVID"
+_RELATIVE_PHRASE_RE = re.compile(r'\b(?:before|after|since|when|during|around)\b')
+
+
 class LastFeltWellRuleset:
     """
     Ruleset for 'When did you last feel really well—body and mind?'
@@ -103,10 +124,10 @@ class LastFeltWellRuleset:
         # Load shared spaCy model
         self.nlp = get_spacy_model()
         
-        # Pre-lemmatize all trigger keywords
-        self.lemmatized_lexicons = preprocess_lexicons(
-            {k: v["keywords"] for k, v in self.TRIGGER_LEXICONS.items()},
-            self.nlp
+        # Pre-lemmatized trigger keywords and lemma → original keyword maps,
+        # built once per spaCy model
+        self.lemmatized_lexicons, self._lemma_to_keyword = (
+            _trigger_lexicons(self.nlp) if self.nlp else ({}, {})
         )
     
     def get_last_felt_well_weights(
@@ -147,6 +168,70 @@ class LastFeltWellRuleset:
         if current_date is None:
             current_date = datetime.now()
         
+        return self._score_text(text_lower, current_date)
+
+    def get_last_felt_well_weights_batch(
+        self,
+        texts: Any,
+        ages: Any = None,
+        current_date: Optional[datetime] = None
+    ) -> List[Tuple[Dict[str, float], Dict[str, bool], List[Dict[str, Any]]]]:
+        """
+        Batch version of get_last_felt_well_weights for many patients at once.
+
+        The scorable answers are lemmatized in one nlp.pipe call instead of one
+        spaCy call per patient, then scored exactly as the scalar method does.
+
+        Args:
+            texts: Iterable of responses (one per patient)
+            ages: Iterable of ages (one per patient) or one age for all rows
+            current_date: Reference date for every row (defaults to today)
+
+        Returns:
+            One (scores_dict, flags_dict, detail_list) tuple per patient,
+            as from get_last_felt_well_weights
+        """
+        texts = list(texts)
+        if ages is None or isinstance(ages, Real):
+            ages = [ages] * len(texts)
+        else:
+            ages = list(ages)
+
+        if current_date is None:
+            current_date = datetime.now()
+
+        # Lowercase every scorable row (same age / empty-text checks as the
+        # scalar method) and lemmatize the distinct answers in one batch
+        texts_lower: List[Optional[str]] = [
+            None if age is None or age < 18 or not text or not text.strip() else text.lower().strip()
+            for text, age in zip(texts, ages)
+        ]
+        distinct = list(dict.fromkeys(text for text in texts_lower if text is not None))
+        lemma_of = dict(zip(distinct, lemmatize_texts(distinct, self.nlp) if self.nlp else distinct))
+
+        results = []
+        for text, age, text_lower in zip(texts, ages, texts_lower):
+            if text_lower is None:
+                results.append(self.get_last_felt_well_weights(text, age, current_date))
+            else:
+                results.append(self._score_text(text_lower, current_date, lemma_of[text_lower]))
+        return results
+
+    def _score_text(
+        self,
+        text_lower: str,
+        current_date: datetime,
+        text_lemmatized: Optional[str] = None
+    ) -> Tuple[Dict[str, float], Dict[str, bool], List[Dict[str, Any]]]:
+        """
+        Score a lowercased, non-empty response (after the age and empty-text checks).
+
+        text_lemmatized may be passed in when responses were lemmatized as a batch.
+        """
+        scores = {code: 0.0 for code in FOCUS_AREAS}
+        flags = {"temporal_uncertain": False}
+        details: List[Dict[str, Any]] = []
+
         # Step 1: Parse temporal information
         months_since_well, temporal_uncertain = self._parse_temporal(text_lower, current_date)
         flags["temporal_uncertain"] = temporal_uncertain
@@ -167,7 +252,7 @@ class LastFeltWellRuleset:
             })
 
         # Step 3: Detect triggers
-        trigger_scores = self._detect_triggers(text_lower)
+        trigger_scores = self._detect_triggers(text_lower, text_lemmatized)
 
         # Track each trigger separately
         for trigger_name, trigger_data in trigger_scores.items():
@@ -199,19 +284,12 @@ class LastFeltWellRuleset:
         temporal_uncertain = False
 
         # Handle "never felt well" cases
-        never_patterns = [
-            r'\bnever\b.*\bwell\b',
-            r'\bnever\b.*\bfelt\b.*\bgood\b',
-            r'\bcan\'?t\s+remember\b',
-            r'\bdon\'?t\s+remember\b'
-        ]
-        for pattern in never_patterns:
-            if re.search(pattern, text):
-                return 120, False  # Use 120 months (10 years) as lower bound
+        if _NEVER_WELL_RE.search(text):
+            return 120, False  # Use 120 months (10 years) as lower bound
 
         # Try to extract relative time FIRST (e.g., "2 years ago", "6 months ago")
         # This takes precedence over year extraction
-        relative_match = re.search(r'(\d+)\s*(year|month|yr|mo)s?\s*ago', text)
+        relative_match = _TIME_AGO_RE.search(text)
         if relative_match:
             number = int(relative_match.group(1))
             unit = relative_match.group(2)
@@ -224,7 +302,7 @@ class LastFeltWellRuleset:
             return months_since, False
 
         # Try to extract year (e.g., "2022", "Summer 2022", "in 2021", "around 2021")
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
+        year_match = _YEAR_RE.search(text)
         if year_match:
             year = int(year_match.group())
 
@@ -249,15 +327,7 @@ class LastFeltWellRuleset:
 
         # Check for relative phrases like "before job change", "after moving", "since COVID"
         # WITHOUT a year - use conservative estimate
-        relative_phrases = [
-            r'\bbefore\b', r'\bafter\b', r'\bsince\b', r'\bwhen\b',
-            r'\bduring\b', r'\baround\b'
-        ]
-        has_relative_phrase = False
-        for pattern in relative_phrases:
-            if re.search(pattern, text):
-                has_relative_phrase = True
-                break
+        has_relative_phrase = _RELATIVE_PHRASE_RE.search(text) is not None
 
         if has_relative_phrase:
             temporal_uncertain = True
@@ -303,17 +373,20 @@ class LastFeltWellRuleset:
         else:
             return "chronic"
 
-    def _detect_triggers(self, text: str) -> Dict[str, Dict[str, Any]]:
+    def _detect_triggers(self, text: str, text_lemmatized: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         Detect trigger events in the text.
 
+        text_lemmatized may be passed in when texts were lemmatized as a batch.
+
         Returns:
             Dict mapping trigger_name to {"matched_text": str, "scores": dict}
         """
         triggers_found = {}
 
         # Lemmatize input text
-        text_lemmatized = lemmatize_text(text, self.nlp) if self.nlp else text
+        if text_lemmatized is None:
+            text_lemmatized = lemmatize_text(text, self.nlp) if self.nlp else text
 
         # Check each trigger category
         for trigger_name, trigger_config in self.TRIGGER_LEXICONS.items():
@@ -321,15 +394,12 @@ class LastFeltWellRuleset:
 
             # Get lemmatized keywords for this trigger
             lemmatized_keywords = self.lemmatized_lexicons.get(trigger_name, set())
+            lemma_to_keyword = self._lemma_to_keyword.get(trigger_name, {})
 
-            # Try exact match first (on lemmatized text)
+            # Try exact match first (on lemmatized text), reporting the original keyword
             for lemma_keyword in lemmatized_keywords:
                 if lemma_keyword in text_lemmatized:
-                    # Find original keyword that matched
-                    for orig_keyword in trigger_config["keywords"]:
-                        if lemmatize_text(orig_keyword, self.nlp) == lemma_keyword:
-                            matched_keywords.append(orig_keyword)
-                            break
+                    matched_keywords.append(lemma_to_keyword[lemma_keyword])
 
             # If no exact match, try fuzzy matching
             if not matched_keywords and RAPIDFUZZ_AVAILABLE:
@@ -363,3 +433,26 @@ class LastFeltWellRuleset:
 
         return triggers_found
 
+
+@lru_cache(maxsize=None)
+def _trigger_lexicons(nlp: Any) -> Tuple[Dict[str, Set[str]], Dict[str, Dict[str, str]]]:
+    """
+    Lemmatized trigger lexicons plus, per trigger, a map from each keyword
+    lemma to the first original keyword with that lemma.
+
+    The keywords are static, so they are lemmatized once per spaCy model
+    rather than for every ruleset instance (one is created per request).
+    """
+    lemmatized_lexicons = preprocess_lexicons(
+        {k: v["keywords"] for k, v in LastFeltWellRuleset.TRIGGER_LEXICONS.items()},
+        nlp
+    )
+
+    lemma_to_keyword: Dict[str, Dict[str, str]] = {}
+    for trigger_name, trigger_config in LastFeltWellRuleset.TRIGGER_LEXICONS.items():
+        keywords: List[str] = list(trigger_config["keywords"])
+        originals = lemma_to_keyword[trigger_name] = {}
+        for keyword, lemma in zip(keywords, lemmatize_texts(keywords, nlp)):
+            originals.setdefault(lemma, keyword)
+
+    return lemmatized_lexicons, lemma_to_keyword
@@ -4,9 +4,19 @@ Mood Ruleset (Field 19): "How would you describe your mood lately?"
 NLP-based lexicon matching with cross-field synergies for sleep, digestive symptoms, and work context.
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, FrozenSet, List, Tuple, Any
 import re
 
+from .constants import build_keyword_automaton
+from .regex_registry import WHITESPACE_RE
+
+
+# Non-ASCII runs (emojis left after the mood-emoji mapping)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
+# Repeated punctuation ("!!!", "?..")
+_REPEATED_PUNCT_RE = re.compile(r'([!?.]){2,}')
+
 
 class MoodRuleset:
     """
@@ -105,27 +115,28 @@ class MoodRuleset:
         text = text.replace("😫", " exhausted ")
         
         # Strip other emojis (simple approach: remove non-ASCII)
-        text = re.sub(r'[^\x00-\x7F]+', ' ', text)
+        text = _NON_ASCII_RE.sub(' ', text)
         
         # Collapse repeated punctuation
-        text = re.sub(r'([!?.]){2,}', r'\1', text)
+        text = _REPEATED_PUNCT_RE.sub(r'\1', text)
         
         # Collapse whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
     def _check_safety(self, text: str) -> bool:
         """Check for self-harm ideation keywords. Returns True if safety concern detected."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.SAFETY_KEYWORDS)
+        return _SAFETY in _scan_lexicons(text.lower())
     
     def _detect_intensity_multiplier(self, text: str) -> float:
         """Detect intensity modifiers and return multiplier (0.8, 1.0, or 1.2)."""
-        text_lower = text.lower()
+        return self._intensity_multiplier(_scan_lexicons(text.lower()))
 
-        has_high = any(keyword in text_lower for keyword in self.HIGH_INTENSITY_KEYWORDS)
-        has_low = any(keyword in text_lower for keyword in self.LOW_INTENSITY_KEYWORDS)
+    def _intensity_multiplier(self, hits: FrozenSet[str]) -> float:
+        """Intensity multiplier (0.8, 1.0, or 1.2) from the lexicon hits of a text."""
+        has_high = _HIGH_INTENSITY in hits
+        has_low = _LOW_INTENSITY in hits
 
         if has_high and not has_low:
             return 1.2  # +20%
@@ -171,23 +182,26 @@ class MoodRuleset:
         # Normalize text
         text = self._normalize_text(text)
 
+        # Every lexicon (safety, intensity and categories) in one pass
+        hits = _scan_lexicons(text)
+
         # Safety check
-        if self._check_safety(text):
+        if _SAFETY in hits:
             flags.append("SAFETY: Self-harm ideation detected - escalate to clinician")
             return weights, flags  # Do not score
 
         # Detect intensity multiplier
-        intensity = self._detect_intensity_multiplier(text)
+        intensity = self._intensity_multiplier(hits)
 
         # Detect categories
-        has_depression = any(kw in text for kw in self.DEPRESSION_KEYWORDS)
-        has_anxiety = any(kw in text for kw in self.ANXIETY_STRESS_KEYWORDS)
-        has_cognitive = any(kw in text for kw in self.COGNITIVE_KEYWORDS)
-        has_fatigue = any(kw in text for kw in self.FATIGUE_KEYWORDS)
-        has_irritability = any(kw in text for kw in self.IRRITABILITY_KEYWORDS)
-        has_positive = any(kw in text for kw in self.POSITIVE_AFFECT_KEYWORDS)
-        has_trauma = any(kw in text for kw in self.TRAUMA_KEYWORDS)
-        has_workplace = any(kw in text for kw in self.WORKPLACE_KEYWORDS)
+        has_depression = _DEPRESSION in hits
+        has_anxiety = _ANXIETY in hits
+        has_cognitive = _COGNITIVE in hits
+        has_fatigue = _FATIGUE in hits
+        has_irritability = _IRRITABILITY in hits
+        has_positive = _POSITIVE in hits
+        has_trauma = _TRAUMA in hits
+        has_workplace = _WORKPLACE in hits
 
         # Check for digestive symptoms (for gut-brain axis)
         has_digestive = bool(digestive_symptoms and digestive_symptoms.strip())
@@ -266,3 +280,51 @@ class MoodRuleset:
 
         return weights, flags
 
+
+# Lexicon codes for the one-pass scan
+_DEPRESSION = "depression"
+_ANXIETY = "anxiety"
+_COGNITIVE = "cognitive"
+_FATIGUE = "fatigue"
+_IRRITABILITY = "irritability"
+_POSITIVE = "positive"
+_TRAUMA = "trauma"
+_WORKPLACE = "workplace"
+_HIGH_INTENSITY = "high_intensity"
+_LOW_INTENSITY = "low_intensity"
+_SAFETY = "safety"
+
+_LEXICONS: Dict[str, List[str]] = {
+    _DEPRESSION: MoodRuleset.DEPRESSION_KEYWORDS,
+    _ANXIETY: MoodRuleset.ANXIETY_STRESS_KEYWORDS,
+    _COGNITIVE: MoodRuleset.COGNITIVE_KEYWORDS,
+    _FATIGUE: MoodRuleset.FATIGUE_KEYWORDS,
+    _IRRITABILITY: MoodRuleset.IRRITABILITY_KEYWORDS,
+    _POSITIVE: MoodRuleset.POSITIVE_AFFECT_KEYWORDS,
+    _TRAUMA: MoodRuleset.TRAUMA_KEYWORDS,
+    _WORKPLACE: MoodRuleset.WORKPLACE_KEYWORDS,
+    _HIGH_INTENSITY: MoodRuleset.HIGH_INTENSITY_KEYWORDS,
+    _LOW_INTENSITY: MoodRuleset.LOW_INTENSITY_KEYWORDS,
+    _SAFETY: MoodRuleset.SAFETY_KEYWORDS,
+}
+
+
+
+def _build_keyword_index(lexicons: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Map each keyword to the codes of every lexicon listing it ("irritable" is anxiety and irritability)."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    for code, keywords in lexicons.items():
+        for keyword in keywords:
+            index[keyword] = index.get(keyword, ()) + (code,)
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index(_LEXICONS)
+_KEYWORD_AUTOMATON = build_keyword_automaton(_KEYWORD_INDEX.items())
+
+
+def _scan_lexicons(text: str) -> FrozenSet[str]:
+    """Codes of every lexicon with a keyword occurring in text (substring match)."""
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(code for _, codes in _KEYWORD_AUTOMATON.iter(text) for code in codes)
+    return frozenset(code for keyword, codes in _KEYWORD_INDEX.items() if keyword in text for code in codes)
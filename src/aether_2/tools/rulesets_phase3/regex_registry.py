@@ -0,0 +1,36 @@
+"""
+Shared compiled regex patterns for Phase 3 rulesets.
+
+Patterns used by more than one ruleset (or on every call of a hot helper) are
+compiled once here at import time, so rulesets running back to back in the
+Phase 3 pipeline reuse the same compiled objects instead of each compiling or
+re-looking-up its own copy.
+"""
+
+import re
+
+from .constants import compile_regex
+
+
+# Whitespace collapse used by the rulesets' _normalize_text helpers.
+# Kept on Python `re`: RE2's \s is ASCII-only and would stop collapsing e.g. \xa0.
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Fractional durations: "5 years", "2.5 yrs", "5y" / "6 months", "6 mo" / "3 weeks", "3 wk"
+DURATION_YEARS_RE = compile_regex(r'(\d+(?:\.\d+)?)\s*(?:years?|yrs?|y\b)')
+DURATION_MONTHS_RE = compile_regex(r'(\d+(?:\.\d+)?)\s*(?:months?|mo\b)')
+DURATION_WEEKS_RE = compile_regex(r'(\d+(?:\.\d+)?)\s*(?:weeks?|wks?|wk\b)')
+
+# Whole-number durations: "2 years", "1yr", "3y" / "6 months", "6mo", "6m"
+INTEGER_YEARS_RE = compile_regex(r'(\d+)\s*(year|yr|y)\b')
+INTEGER_MONTHS_RE = compile_regex(r'(\d+)\s*(month|mo|m)\b')
+
+
+__all__ = [
+    "WHITESPACE_RE",
+    "DURATION_YEARS_RE",
+    "DURATION_MONTHS_RE",
+    "DURATION_WEEKS_RE",
+    "INTEGER_YEARS_RE",
+    "INTEGER_MONTHS_RE",
+]
@@ -19,6 +19,8 @@ Key features:
 
 from typing import Dict, List, Tuple
 
+from .regex_registry import WHITESPACE_RE
+
 
 class SeasonalAllergiesRuleset:
     """Ruleset for evaluating seasonal allergies and pollen-food cross-reactivity."""
@@ -63,8 +65,7 @@ class SeasonalAllergiesRuleset:
             return ""
         text = text.lower().strip()
         # Collapse multiple spaces/newlines
-        import re
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text
     
     def _detect_allergens(self, text: str) -> List[str]:
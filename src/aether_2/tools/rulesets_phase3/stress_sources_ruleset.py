@@ -7,6 +7,8 @@ NLP-based stressor categorization with cross-field synergies.
 from typing import Dict, List, Tuple, Any, Set
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class StressSourcesRuleset:
     """
@@ -141,7 +143,7 @@ class StressSourcesRuleset:
         text = re.sub(r'([!?.,;:])\1+', r'\1', text)
 
         # Collapse whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
 
         return text.strip()
 
@@ -26,6 +26,8 @@ Per-field cap: All domains ≤ +1.0
 from typing import Dict, List, Tuple, Any
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class SyntheticFiberWearRuleset:
     """Ruleset for evaluating synthetic fiber wear exposure."""
@@ -38,7 +40,7 @@ class SyntheticFiberWearRuleset:
         if not text:
             return ""
         text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text
     
     def _detect_heavy_sweating(self, text: str) -> bool:
@@ -22,6 +22,8 @@ Per-field cap: All domains ≤ +0.8
 from typing import Dict, List, Tuple, Any
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class ToothSensitivityRuleset:
     """Ruleset for evaluating tooth sensitivity."""
@@ -33,7 +35,7 @@ class ToothSensitivityRuleset:
         """Normalize text for keyword matching."""
         text_lower = text.lower()
         # Collapse whitespace
-        text_normalized = re.sub(r'\s+', ' ', text_lower).strip()
+        text_normalized = WHITESPACE_RE.sub(' ', text_lower).strip()
         return text_normalized
     
     def _detect_acid_erosion(self, text: str) -> bool:
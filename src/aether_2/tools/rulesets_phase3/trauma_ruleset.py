@@ -6,6 +6,8 @@ Evaluates trauma history with NLP-based keyword detection and privacy safeguards
 from typing import Dict, List, Tuple, Any, Optional
 import re
 
+from .regex_registry import WHITESPACE_RE
+
 
 class TraumaRuleset:
     """Ruleset for evaluating trauma/abuse history."""
@@ -105,7 +107,7 @@ class TraumaRuleset:
         # Lowercase
         text = text.lower()
         # Collapse whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         # Strip leading/trailing whitespace
         text = text.strip()
         return text
@@ -5,7 +5,20 @@ Helper functions for processing free-text responses in Phase 3 rulesets.
 """
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+
+
+_DEFAULT_DELIMITERS = (',', ';', '\n', '|', '•', '-')
+
+# Leading list numbering like "1.", "2)"
+_NUMBERING_RE = re.compile(r'^\d+[\.\)]\s*')
+
+
+@lru_cache(maxsize=32)
+def _delimiter_pattern(delimiters: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile (once per delimiter set) an alternation of the escaped delimiters."""
+    return re.compile('|'.join(re.escape(d) for d in delimiters))
 
 
 def split_by_delimiters(text: str, delimiters: List[str] = None) -> List[str]:
@@ -29,23 +42,17 @@ def split_by_delimiters(text: str, delimiters: List[str] = None) -> List[str]:
     if not text:
         return []
     
-    if delimiters is None:
-        delimiters = [',', ';', '\n', '|', '•', '-']
-    
-    # Create regex pattern from delimiters
-    # Escape special regex characters
-    escaped_delimiters = [re.escape(d) for d in delimiters]
-    pattern = '|'.join(escaped_delimiters)
-    
-    # Split by any delimiter
-    items = re.split(pattern, text)
+    # Split by any delimiter (pattern compiled once per delimiter set)
+    pattern = _delimiter_pattern(_DEFAULT_DELIMITERS if delimiters is None else tuple(delimiters))
+    items = pattern.split(text)
     
     # Clean up: strip whitespace, remove empty strings, remove numbering
     cleaned_items = []
     for item in items:
         item = item.strip()
-        # Remove leading numbers like "1.", "2)", etc.
-        item = re.sub(r'^\d+[\.\)]\s*', '', item)
+        # Remove leading numbers like "1.", "2)", etc. (only items starting with a digit can match)
+        if item[:1].isdigit():
+            item = _NUMBERING_RE.sub('', item)
         if item:
             cleaned_items.append(item)
     
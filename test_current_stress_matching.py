@@ -0,0 +1,89 @@
+"""
+Test suite for Current Stress ruleset
+Tests that batch scoring matches the scalar scorer row for row
+"""
+
+from src.aether_2.tools.rulesets_phase3.current_stress_ruleset import CurrentStressRuleset
+
+
+def test_current_stress_batch_parity():
+    """get_current_stress_weights_batch returns the scalar weights for every row."""
+
+    print("Initializing ruleset...")
+    ruleset = CurrentStressRuleset()
+
+    # Rows: (description, stress_score, age, sleep_hours, sleep_irregular, shift_work, work_stress_level)
+    rows = [
+        ("None score", None, 30, None, False, False, None),
+        ("Empty score", "", 30, None, False, False, None),
+        ("Non-numeric score", "abc", 30, None, False, False, None),
+        ("Low stress", 2, 30, None, False, False, None),
+        ("Moderate stress (string)", "5", 30, 7.5, False, False, None),
+        ("High stress", 9, 30, None, False, False, None),
+        ("Under 18", 9, 17, 5.0, True, True, 9),
+        ("Unknown age", 8, None, None, False, False, None),
+        ("Short sleep + high stress", 8, 42, 5.0, False, False, None),
+        ("Irregular sleep + high stress", 7, 42, None, True, False, None),
+        ("Short sleep + low stress", 4, 42, 5.0, False, False, None),
+        ("Shift work", 3, 42, None, False, True, None),
+        ("High work stress", 6, 42, None, False, False, 8),
+        ("Fractional score", 7.9, 42, None, False, False, 3),
+        ("Padded string score", " 6 ", 42, None, False, False, None),
+        ("Below range", 0, 42, None, False, False, None),
+        ("Above range", 11, 42, 5.0, True, True, 10),
+    ]
+    columns = list(zip(*rows))
+
+    batch_weights = ruleset.get_current_stress_weights_batch(
+        list(columns[1]),
+        ages=list(columns[2]),
+        sleep_hours=list(columns[3]),
+        sleep_irregular=list(columns[4]),
+        shift_work=list(columns[5]),
+        work_stress_level=list(columns[6])
+    )
+
+    passed = 0
+    total = len(rows)
+
+    for i, (description, score, age, sleep_hours, sleep_irregular, shift_work, work_stress_level) in enumerate(rows):
+        print(f"\nRow {i + 1}: {description}")
+        print(f"  Input: {score!r} (age {age})")
+
+        weights, _ = ruleset.get_current_stress_weights(
+            score,
+            age=age,
+            sleep_hours=sleep_hours,
+            sleep_irregular=sleep_irregular,
+            shift_work=shift_work,
+            work_stress_level=work_stress_level
+        )
+        mismatched = [
+            fa for fa, column in batch_weights.items()
+            if abs(column[i] - weights.get(fa, 0.0)) > 1e-9
+        ]
+
+        if not mismatched:
+            print(f"  ✅ PASS")
+            passed += 1
+        else:
+            print(f"  ❌ FAIL")
+            print(f"     Scalar: {weights}")
+            print(f"     Batch:  { {fa: float(column[i]) for fa, column in batch_weights.items()} }")
+
+    empty_weights = ruleset.get_current_stress_weights_batch([])
+    total += 1
+    if all(len(column) == 0 for column in empty_weights.values()):
+        passed += 1
+    else:
+        print(f"\n❌ FAIL: empty batch returned {empty_weights}")
+
+    print(f"\n{'='*60}")
+    print(f"SUMMARY: {passed}/{total} tests passed")
+    print(f"{'='*60}")
+
+    assert passed == total
+
+
+if __name__ == "__main__":
+    test_current_stress_batch_parity()
@@ -0,0 +1,149 @@
+"""
+Test suite for Food Avoidance ruleset
+Tests typo-tolerant (fuzzy) food matching and its false-positive guards
+"""
+
+from src.aether_2.tools.rulesets_phase3.food_avoidance_ruleset import FoodAvoidanceRuleset
+from src.aether_2.tools.rulesets_phase3.constants import RAPIDFUZZ_AVAILABLE, WORDFREQ_AVAILABLE
+
+
+def _detected_categories(flags):
+    """Categories from the 'Detected: a, b' flag (empty set if none)."""
+    for flag in flags:
+        if flag.startswith("Detected: "):
+            return set(flag[len("Detected: "):].split(", "))
+    return set()
+
+
+def test_food_avoidance_fuzzy_matching():
+    """Misspelled foods are matched; everyday words near food keywords are not."""
+
+    print("Initializing ruleset...")
+    ruleset = FoodAvoidanceRuleset()
+
+    # Test cases: (description, input_text, expected_categories, needs_fuzzy_pass)
+    test_cases = [
+        # Everyday words one edit away from a food keyword must not match
+        ("'what' is not wheat", "Yes; what i eat late causes reflux", set(), False),
+        ("'heat' is not wheat", "Yes; heat makes it worse", set(), False),
+        ("'what's' is not wheat", "Yes; what's the point", set(), False),
+        ("'plus' / 'ears' are not plums / pears", "Yes; ringing ears plus headaches", set(), False),
+        ("'pearls' is not pears", "Yes; tapioca pearls", set(), False),
+        ("'range' is not orange", "Yes; a range of things", set(), False),
+        ("'friend' is not fried", "Yes; my friend told me to", set(), False),
+        ("'scream' is not cream", "Yes; makes me want to scream", set(), False),
+        ("'beacon' is not bacon", "Yes; beacon", set(), False),
+        ("'better' is not butter", "Yes; feel better without it", set(), False),
+        ("'daily' is not dairy", "Yes; daily", set(), False),
+        ("'daisy' is not dairy", "Yes; I avoid them when my daisy is around", set(), False),
+        ("'plugs' is not plums", "Yes; no plugs", set(), False),
+        ("'baton' is not bacon", "Yes; pasta with baton", {"gluten_wheat"}, False),
+        ("'what' next to a real food",
+         "Yes; not sure what it is, dairy makes me bloated", {"lactose_dairy"}, False),
+
+        # Misspellings of 5+ letter foods still match
+        ("Misspelled lactose", "Yes; lactoze", {"lactose_dairy"}, True),
+        ("Misspelled gluten", "Yes; glutten", {"gluten_wheat"}, True),
+        ("Misspelled broccoli", "Yes; brocoli", {"high_fodmap"}, True),
+        ("Swapped letters in onion", "Yes; onoin", {"high_fodmap"}, True),
+        ("Misspelled cheese", "Yes; cheeze", {"lactose_dairy"}, True),
+        ("Misspelled multi-word food", "Yes; ice craem", {"lactose_dairy"}, True),
+    ]
+
+    passed = 0
+    total = 0
+
+    for i, (description, input_text, expected, needs_fuzzy_pass) in enumerate(test_cases, 1):
+        if needs_fuzzy_pass and not (RAPIDFUZZ_AVAILABLE and WORDFREQ_AVAILABLE):
+            print(f"\nTest {i}: {description} - skipped (rapidfuzz or wordfreq not installed)")
+            continue
+        total += 1
+
+        print(f"\nTest {i}: {description}")
+        print(f"  Input: '{input_text}'")
+
+        weights, flags = ruleset.get_food_avoidance_weights(input_text, age=30)
+        actual = _detected_categories(flags)
+
+        if actual == expected:
+            print(f"  ✅ PASS")
+            passed += 1
+        else:
+            print(f"  ❌ FAIL")
+            print(f"     Expected: {sorted(expected)}")
+            print(f"     Got:      {sorted(actual)}")
+            print(f"     Weights:  {weights}")
+
+    print(f"\n{'='*60}")
+    print(f"SUMMARY: {passed}/{total} tests passed")
+    print(f"{'='*60}")
+
+    assert passed == total
+
+
+def test_food_avoidance_batch_parity():
+    """get_food_avoidance_weights_batch returns the scalar weights and flags for every row."""
+
+    print("Initializing ruleset...")
+    ruleset = FoodAvoidanceRuleset()
+
+    # Rows: (description, input, age)
+    rows = [
+        ("None input", None, 30),
+        ("Empty input", "", 30),
+        ("Plain no", "No", 30),
+        ("Yes without followup", "Yes", 30),
+        ("Single category", "Yes; milk gives me bloating", 30),
+        ("Under 18", "Yes; milk gives me bloating", 17),
+        ("Unknown age", "Yes; gluten and onions", None),
+        ("Broad sensitivities", "Yes; gluten, milk, onions, tomato, wine", 45),
+        ("Elimination response", "Yes; dairy, feel better since removed", 52),
+        ("Immediate reaction", "Yes; shellfish, hives and throat closing", 28),
+        ("GERD severity", "Yes; spicy food and coffee cause reflux at night", 61),
+        ("Dict input", {"answer": "yes", "followup": "cheese rash"}, 33),
+        ("Duplicate text", "Yes; milk gives me bloating", 40),
+        ("Everyday words only", "Yes; what i eat late", 30),
+    ]
+    texts = [text for _, text, _ in rows]
+    ages = [age for _, _, age in rows]
+
+    batch_weights, batch_flags = ruleset.get_food_avoidance_weights_batch(texts, ages)
+
+    passed = 0
+    total = len(rows)
+
+    for i, (description, text, age) in enumerate(rows):
+        print(f"\nRow {i + 1}: {description}")
+        print(f"  Input: {text!r} (age {age})")
+
+        weights, flags = ruleset.get_food_avoidance_weights(text, age=age)
+        mismatched = [
+            fa for fa, column in batch_weights.items()
+            if abs(column[i] - weights.get(fa, 0.0)) > 1e-9
+        ]
+
+        if not mismatched and batch_flags[i] == flags:
+            print(f"  ✅ PASS")
+            passed += 1
+        else:
+            print(f"  ❌ FAIL")
+            print(f"     Scalar: {weights} {flags}")
+            print(f"     Batch:  { {fa: float(column[i]) for fa, column in batch_weights.items()} } {batch_flags[i]}")
+
+    empty_weights, empty_flags = ruleset.get_food_avoidance_weights_batch([])
+    total += 1
+    if empty_flags == [] and all(len(column) == 0 for column in empty_weights.values()):
+        passed += 1
+    else:
+        print(f"\n❌ FAIL: empty batch returned {empty_weights} {empty_flags}")
+
+    print(f"\n{'='*60}")
+    print(f"SUMMARY: {passed}/{total} tests passed")
+    print(f"{'='*60}")
+
+    assert passed == total
+
+
+if __name__ == "__main__":
+    test_food_avoidance_fuzzy_matching()
+    test_food_avoidance_batch_parity()
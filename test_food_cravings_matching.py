@@ -0,0 +1,81 @@
+"""
+Test suite for Food Cravings ruleset
+Tests that batch scoring matches the scalar scorer row for row
+"""
+
+from src.aether_2.tools.rulesets_phase3.food_cravings_ruleset import FoodCravingsRuleset
+
+
+def test_food_cravings_batch_parity():
+    """get_food_cravings_weights_batch returns the scalar weights and flags for every row."""
+
+    print("Initializing ruleset...")
+    ruleset = FoodCravingsRuleset()
+
+    # Rows: (description, cravings, sleep_hours, sleep_irregular, sex, menstrual_pattern, other_symptoms)
+    rows = [
+        ("None input", None, None, False, None, None, None),
+        ("Empty input", "", None, False, None, None, None),
+        ("None selected", "None", None, False, None, None, None),
+        ("Single craving", "Sweets", None, False, None, None, None),
+        ("Several cravings", "Sweets, Salty, Bread/Pasta", 7.0, False, "male", None, None),
+        ("Daily frequency", "Chocolate daily", None, False, None, None, None),
+        ("Sweets + short sleep", "Sweets", 5.0, False, None, None, None),
+        ("Sweets + irregular sleep", "Sweets", None, True, None, None, None),
+        ("Bread + post-meal crash", "Bread/Pasta", None, False, None, None, "sleepy after meals"),
+        ("Chocolate + cyclical pattern", "Chocolate", None, False, "female", "cravings before period", None),
+        ("Heavy caffeine", "Caffeine; 4 cups of coffee a day", None, False, None, None, None),
+        ("Salty + dizziness", "Salty", None, False, None, None, "dizzy when standing"),
+        ("Other free text", "Other: wine and fast food late at night", None, False, None, None, None),
+        ("Duplicate answer", "Sweets", 8.0, False, "female", None, None),
+    ]
+    columns = list(zip(*rows))
+
+    batch_weights, batch_flags = ruleset.get_food_cravings_weights_batch(
+        list(columns[1]),
+        sleep_hours=[float("nan") if hours is None else hours for hours in columns[2]],
+        sleep_irregular=list(columns[3]),
+        sex=list(columns[4]),
+        menstrual_pattern=list(columns[5]),
+        other_symptoms=list(columns[6])
+    )
+
+    passed = 0
+    total = len(rows)
+
+    for i, (description, cravings, sleep_hours, sleep_irregular, sex, pattern, symptoms) in enumerate(rows):
+        print(f"\nRow {i + 1}: {description}")
+        print(f"  Input: {cravings!r}")
+
+        weights, flags = ruleset.get_food_cravings_weights(
+            cravings, sleep_hours, sleep_irregular, sex, pattern, symptoms
+        )
+        mismatched = [
+            domain for domain, column in batch_weights.items()
+            if abs(column[i] - weights.get(domain, 0.0)) > 1e-9
+        ]
+
+        if not mismatched and batch_flags[i] == flags:
+            print(f"  ✅ PASS")
+            passed += 1
+        else:
+            print(f"  ❌ FAIL")
+            print(f"     Scalar: {weights} {flags}")
+            print(f"     Batch:  { {d: float(column[i]) for d, column in batch_weights.items()} } {batch_flags[i]}")
+
+    empty_weights, empty_flags = ruleset.get_food_cravings_weights_batch([])
+    total += 1
+    if empty_flags == [] and all(len(column) == 0 for column in empty_weights.values()):
+        passed += 1
+    else:
+        print(f"\n❌ FAIL: empty batch returned {empty_weights} {empty_flags}")
+
+    print(f"\n{'='*60}")
+    print(f"SUMMARY: {passed}/{total} tests passed")
+    print(f"{'='*60}")
+
+    assert passed == total
+
+
+if __name__ == "__main__":
+    test_food_cravings_batch_parity()
@@ -4,6 +4,9 @@ Tests temporal parsing, chronicity overlay, and trigger detection
 """
 
 from datetime import datetime
+
+import numpy as np
+
 from src.aether_2.tools.rulesets_phase3.last_felt_well_ruleset import LastFeltWellRuleset
 
 
@@ -176,6 +179,69 @@ def test_last_felt_well_matching():
     print(f"{'='*60}")
 
 
+def test_last_felt_well_batch_parity():
+    """get_last_felt_well_weights_batch returns the scalar result for every row."""
+
+    print("Initializing ruleset...")
+    ruleset = LastFeltWellRuleset()
+    test_date = datetime(2024, 1, 1)
+
+    # Rows: (description, input_text, age)
+    rows = [
+        ("None input", None, 30),
+        ("Empty input", "", 30),
+        ("Whitespace only", "   ", 30),
+        ("Unknown age", "2 years ago", None),
+        ("Under 18", "2 years ago after covid", 17),
+        ("Relative time", "2 years ago", 30),
+        ("Season and year", "Summer 2022", 45),
+        ("Post-viral trigger", "Since I had covid in 2021", 38),
+        ("GI infection trigger", "After food poisoning 6 months ago, bloating since", 29),
+        ("Mold trigger", "Before we moved into the moldy apartment in 2019", 52),
+        ("Never felt well", "I can't remember, never really", 41),
+        ("Duplicate text", "2 years ago", 60),
+    ]
+    texts = [text for _, text, _ in rows]
+    ages = [age for _, _, age in rows]
+
+    # Per-row ages, then one age broadcast over every row (plain int and numpy scalar)
+    batches = [(ages, ruleset.get_last_felt_well_weights_batch(texts, ages, test_date))]
+    for shared_age in (40, np.int64(40)):
+        batches.append(([shared_age] * len(rows), ruleset.get_last_felt_well_weights_batch(texts, shared_age, test_date)))
+
+    passed = 0
+    total = 0
+
+    for row_ages, results in batches:
+        for i, ((description, text, _), age) in enumerate(zip(rows, row_ages)):
+            total += 1
+            print(f"\nRow {i + 1}: {description}")
+            print(f"  Input: {text!r} (age {age!r})")
+
+            expected = ruleset.get_last_felt_well_weights(text, age, test_date)
+
+            if results[i] == expected:
+                print(f"  ✅ PASS")
+                passed += 1
+            else:
+                print(f"  ❌ FAIL")
+                print(f"     Scalar: {expected}")
+                print(f"     Batch:  {results[i]}")
+
+    total += 1
+    if ruleset.get_last_felt_well_weights_batch([], None, test_date) == []:
+        passed += 1
+    else:
+        print("\n❌ FAIL: empty batch returned results")
+
+    print(f"\n{'='*60}")
+    print(f"SUMMARY: {passed}/{total} tests passed")
+    print(f"{'='*60}")
+
+    assert passed == total
+
+
 if __name__ == "__main__":
     test_last_felt_well_matching()
+    test_last_felt_well_batch_parity()
 
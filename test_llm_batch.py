@@ -0,0 +1,47 @@
+"""
+Test suite for call_vertex_ai_llm_batch
+Runs against a stand-in litellm.acompletion, so no network access is needed
+"""
+
+import asyncio
+import sys
+import types
+
+from src.aether_2.tools.rulesets_phase3.constants import call_vertex_ai_llm_batch
+
+
+async def _fake_acompletion(model, messages, temperature, max_tokens):
+    """Echo the prompt upper-cased; fail for the prompt 'bad'."""
+    prompt = messages[0]["content"]
+    await asyncio.sleep(0)
+    if prompt == "bad":
+        raise ValueError("boom")
+    message = types.SimpleNamespace(content=f" {prompt.upper()} ")
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def test_llm_batch():
+    """Results keep prompt order, failures are None, and repeated event loops work."""
+    fake_litellm = types.ModuleType("litellm")
+    fake_litellm.acompletion = _fake_acompletion
+    real_litellm = sys.modules.get("litellm")
+    sys.modules["litellm"] = fake_litellm
+    try:
+        # Each asyncio.run uses a fresh event loop; the second batch must not fail
+        for _ in range(2):
+            results = asyncio.run(call_vertex_ai_llm_batch(["pizza", "bad", "salad"]))
+            print(f"Results: {results}")
+            assert results == ["PIZZA", None, "SALAD"]
+
+        assert asyncio.run(call_vertex_ai_llm_batch([])) == []
+    finally:
+        if real_litellm is None:
+            del sys.modules["litellm"]
+        else:
+            sys.modules["litellm"] = real_litellm
+
+    print("✅ All tests passed!")
+
+
+if __name__ == "__main__":
+    test_llm_batch()